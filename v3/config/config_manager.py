@@ -14,6 +14,7 @@ import hmac
 import json
 import logging
 import os
+from types import MappingProxyType
 from typing import Any, Dict, Optional, Tuple
 
 from config.settings import BASE_PATH, USER_DATA_DIR
@@ -64,6 +65,24 @@ class Config:
             _logger.warning(f"설정값 조회 실패 ({dotted_key}): {e}")
             return default
 
+    def get_view(self, dotted_key: str, default: Any = None) -> Any:
+        """Like get(), but returns a read-only view instead of a deep copy.
+
+        Dicts come back as MappingProxyType and lists as tuples; nested values are
+        shared with the loaded config, so use this only for values the caller reads.
+        """
+        node: Any = self._data
+        for part in dotted_key.split("."):
+            if isinstance(node, dict) and part in node:
+                node = node[part]
+            else:
+                return default
+        if isinstance(node, dict):
+            return MappingProxyType(node)
+        if isinstance(node, list):
+            return tuple(node)
+        return node
+
     # Convenience properties used in settings
     @property
     def default_scale(self) -> str:
@@ -101,10 +120,17 @@ class Config:
     def save_scan_effects(self, effects_data: dict) -> bool:
         """Save the scan effects settings to the config file."""
         try:
-            if 'scan_effects' not in self._data:
-                self._data['scan_effects'] = {}
-            self._data['scan_effects'].update(effects_data)
-            return self._save_config()
+            current = self._data.setdefault('scan_effects', {})
+            if all(k in current and current[k] == v for k, v in effects_data.items()):
+                return True
+            previous = dict(current)
+            current.update(effects_data)
+            if self._save_config():
+                return True
+            # Keep memory in step with the file so a retry with the same values writes again
+            current.clear()
+            current.update(previous)
+            return False
         except Exception as e:
             _logger.warning(f"스캔 효과 저장 실패: {e}")
             return False
@@ -112,10 +138,7 @@ class Config:
     def save_workers(self, workers: list) -> bool:
         """Save the workers list to the config file."""
         try:
-            if 'mixing' not in self._data:
-                self._data['mixing'] = {}
-            self._data['mixing']['workers'] = workers
-            return self._save_config()
+            return self._save_section_value('mixing', 'workers', list(workers))
         except Exception as e:
             _logger.warning(f"작업자 목록 저장 실패: {e}")
             return False
@@ -123,10 +146,7 @@ class Config:
     def save_last_worker(self, worker_name: str) -> bool:
         """Save the last selected worker to the config file."""
         try:
-            if 'mixing' not in self._data:
-                self._data['mixing'] = {}
-            self._data['mixing']['last_worker'] = worker_name
-            return self._save_config()
+            return self._save_section_value('mixing', 'last_worker', worker_name)
         except Exception as e:
             _logger.warning(f"마지막 작업자 저장 실패: {e}")
             return False
@@ -139,10 +159,7 @@ class Config:
     def save_sidebar_hover_expand(self, enabled: bool) -> bool:
         """Save sidebar hover auto-expand setting."""
         try:
-            if "ui" not in self._data or not isinstance(self._data.get("ui"), dict):
-                self._data["ui"] = {}
-            self._data["ui"]["sidebar_hover_expand"] = bool(enabled)
-            return self._save_config()
+            return self._save_section_value("ui", "sidebar_hover_expand", bool(enabled))
         except Exception as e:
             _logger.warning(f"sidebar hover expand save failed: {e}")
             return False
@@ -213,6 +230,28 @@ class Config:
         dk = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt, 200000)
         return hmac.compare_digest(dk, expected)
 
+    def _save_section_value(self, section: str, key: str, value: Any) -> bool:
+        """Store a value under a top-level section, writing the file only when it changed.
+
+        The in-memory value is rolled back if the write fails, so the unchanged check always
+        compares against what was last saved.
+        """
+        node = self._data.get(section)
+        if not isinstance(node, dict):
+            node = {}
+            self._data[section] = node
+        had_key, previous = key in node, node.get(key)
+        if had_key and previous == value:
+            return True
+        node[key] = value
+        if self._save_config():
+            return True
+        if had_key:
+            node[key] = previous
+        else:
+            del node[key]
+        return False
+
     def _save_config(self) -> bool:
         """Save the config data to file."""
         try:
@@ -4,7 +4,7 @@
 import os
 import json
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from config.settings import USER_CONFIG_DIR
 from utils.logger import logger  # v3/main 환경에 맞춰 수정
@@ -17,6 +17,8 @@ class GoogleSheetsConfig:
         self.config_file = os.path.join(USER_CONFIG_DIR, 'google_sheets_settings.json')
         self.legacy_config_file = os.path.join(os.path.dirname(__file__), 'google_sheets_settings.json')
         self.config = self._load_config()
+        # (설정된 경로, 실제 찾은 경로) - 상대 경로 탐색 결과 재사용
+        self._resolved_credentials: Optional[Tuple[str, str]] = None
     
     def _load_config(self) -> Dict[str, Any]:
         """설정 파일 로드"""
@@ -68,7 +70,19 @@ class GoogleSheetsConfig:
         
         if not file_path:
             return ''
-        
+
+        # 이전에 찾은 경로가 아직 있으면 후보 경로를 다시 탐색하지 않음
+        cached = self._resolved_credentials
+        if cached and cached[0] == file_path and os.path.exists(cached[1]):
+            return cached[1]
+
+        resolved = self._resolve_credentials_file(file_path)
+        if os.path.exists(resolved):
+            self._resolved_credentials = (file_path, resolved)
+        return resolved
+
+    def _resolve_credentials_file(self, file_path: str) -> str:
+        """설정된 인증 파일 경로를 실제 존재하는 경로로 찾아 반환"""
         # 절대 경로가 존재하면 그대로 반환
         if os.path.isabs(file_path) and os.path.exists(file_path):
             return file_path
@@ -98,6 +112,7 @@ class GoogleSheetsConfig:
     def set_credentials_file(self, file_path: str) -> None:
         """인증 파일 경로 설정"""
         self.config['credentials_file'] = file_path
+        self._resolved_credentials = None
         self.save_config()
     
     def get_spreadsheet_url(self) -> str:
@@ -158,10 +173,10 @@ class GoogleSheetsConfig:
     
     def has_valid_settings(self) -> bool:
         """필수 설정값(인증파일, URL) 유효성 확인"""
+        if not self.get_spreadsheet_url():
+            return False
         credentials_file = self.get_credentials_file()
-        return (bool(credentials_file) and 
-                os.path.exists(credentials_file) and 
-                bool(self.get_spreadsheet_url()))
+        return bool(credentials_file) and os.path.exists(credentials_file)
 
     def is_configured(self) -> bool:
         """설정 완료 및 활성화 여부 확인"""
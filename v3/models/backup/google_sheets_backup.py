@@ -6,10 +6,8 @@ BackupProvider 프로토콜을 구현합니다.
 import os
 from typing import Protocol, List, Dict, Any, Tuple
 from datetime import datetime
-import gspread
-from google.oauth2.service_account import Credentials
-from google.auth.exceptions import DefaultCredentialsError, TransportError
 
+# gspread/google-auth는 무거운 패키지라 백업이 실제로 실행될 때 가져옴 (백업을 쓰지 않는 실행의 시작 시간 단축)
 from config.google_sheets_config import GoogleSheetsConfig
 from utils.logger import logger
 
@@ -38,6 +36,11 @@ class GoogleSheetsBackup:
     def __init__(self, google_sheets_config: GoogleSheetsConfig):
         self.config = google_sheets_config
         self.gc = None # gspread 클라이언트
+        # 백업마다 스프레드시트/워크시트 메타데이터를 다시 받지 않도록 워크시트 핸들을 URL별로 보관
+        self._worksheet = None
+        self._worksheet_url = None
+        # 열어 둔 워크시트에서 이미 확인(또는 기록)한 헤더 - 같으면 헤더 행 조회를 생략
+        self._verified_headers = None
 
     def _authenticate(self) -> bool:
         """Google Sheets API 인증을 수행합니다."""
@@ -49,6 +52,10 @@ class GoogleSheetsBackup:
             logger.error(f"Google Sheets 인증 파일이 없거나 찾을 수 없습니다: {creds_file}")
             return False
 
+        import gspread
+        from google.oauth2.service_account import Credentials
+        from google.auth.exceptions import DefaultCredentialsError, TransportError
+
         try:
             # 서비스 계정 인증
             creds = Credentials.from_service_account_file(creds_file, scopes=SCOPES)
@@ -65,6 +72,21 @@ class GoogleSheetsBackup:
             logger.error(f"Google Sheets 인증 중 알 수 없는 오류 발생: {e}")
             return False
 
+    def _get_worksheet(self, spreadsheet_url: str):
+        """'배합 기록' 워크시트를 반환합니다 (같은 URL이면 이전에 연 핸들을 재사용)."""
+        if self._worksheet is None or self._worksheet_url != spreadsheet_url:
+            spreadsheet = self.gc.open_by_url(spreadsheet_url)
+            self._worksheet = spreadsheet.worksheet("배합 기록") # 워크시트 이름을 '배합 기록'으로 가정
+            self._worksheet_url = spreadsheet_url
+            self._verified_headers = None
+        return self._worksheet
+
+    def _reset_worksheet(self):
+        """오류 후에는 다음 백업에서 스프레드시트를 다시 엽니다."""
+        self._worksheet = None
+        self._worksheet_url = None
+        self._verified_headers = None
+
     def backup_records(self, records: List[Dict[str, Any]]) -> Tuple[bool, str]:
         """
         주어진 기록들을 Google Sheets에 백업합니다.
@@ -76,19 +98,19 @@ class GoogleSheetsBackup:
         if not self.config.is_backup_enabled():
             return False, "Google Sheets 백업이 비활성화되어 있습니다."
         
-        if not self.config.is_configured():
+        # 활성화 여부는 위에서 확인했으므로 is_configured()로 다시 조회하지 않고 필수 설정값만 확인
+        if not self.config.has_valid_settings():
             return False, "Google Sheets 설정이 완료되지 않았습니다 (인증 파일 또는 스프레드시트 URL 누락)."
 
         if not self._authenticate():
             return False, "Google Sheets API 인증에 실패했습니다."
 
+        import gspread  # 인증에서 이미 로드됨 (예외 타입 참조용)
+
         spreadsheet_url = self.config.get_spreadsheet_url()
         try:
-            # 스프레드시트 열기
-            spreadsheet = self.gc.open_by_url(spreadsheet_url)
-            
-            # 첫 번째 워크시트 선택 (혹은 이름으로 특정 워크시트 선택)
-            worksheet = spreadsheet.worksheet("배합 기록") # 워크시트 이름을 '배합 기록'으로 가정
+            # 스프레드시트 열기 및 워크시트 선택 (열어 둔 핸들 재사용)
+            worksheet = self._get_worksheet(spreadsheet_url)
             
             if not records:
                 logger.info("백업할 기록이 없습니다.")
@@ -97,15 +119,17 @@ class GoogleSheetsBackup:
             # 헤더 추출 (첫 번째 기록의 키들을 사용)
             headers = list(records[0].keys())
             
-            # 기존 헤더 확인 및 업데이트 (선택 사항: 필요한 경우)
-            existing_headers = worksheet.row_values(1)
-            if not existing_headers:
-                worksheet.insert_row(headers, 1)
-            elif existing_headers != headers:
-                msg = "Google Sheets 헤더가 백업 데이터와 다릅니다. 헤더를 맞춘 후 다시 시도하세요."
-                logger.error(f"{msg} 기존: {existing_headers}, 기대: {headers}")
-                self.config.increment_backup_failure()
-                return False, msg
+            # 기존 헤더 확인 및 업데이트 (이 워크시트에서 이미 확인한 헤더면 조회 생략)
+            if headers != self._verified_headers:
+                existing_headers = worksheet.row_values(1)
+                if not existing_headers:
+                    worksheet.insert_row(headers, 1)
+                elif existing_headers != headers:
+                    msg = "Google Sheets 헤더가 백업 데이터와 다릅니다. 헤더를 맞춘 후 다시 시도하세요."
+                    logger.error(f"{msg} 기존: {existing_headers}, 기대: {headers}")
+                    self.config.increment_backup_failure()
+                    return False, msg
+                self._verified_headers = headers
             
             # 데이터를 gspread에 맞는 형식으로 변환 (리스트의 리스트)
             data_to_append = [list(record.values()) for record in records]
@@ -119,14 +143,17 @@ class GoogleSheetsBackup:
             return True, f"{len(records)}개의 기록을 Google Sheets에 성공적으로 백업했습니다."
 
         except gspread.exceptions.SpreadsheetNotFound:
+            self._reset_worksheet()
             logger.error(f"지정된 Google 스프레드시트 '{spreadsheet_url}'를 찾을 수 없습니다.")
             self.config.increment_backup_failure()
             return False, f"Google 스프레드시트 '{spreadsheet_url}'를 찾을 수 없습니다."
         except gspread.exceptions.WorksheetNotFound:
+            self._reset_worksheet()
             logger.error(f"스프레드시트 내에 '배합 기록' 워크시트를 찾을 수 없습니다.")
             self.config.increment_backup_failure()
             return False, f"'배합 기록' 워크시트를 찾을 수 없습니다."
         except Exception as e:
+            self._reset_worksheet()
             logger.error(f"Google Sheets 백업 중 오류 발생: {e}")
             self.config.increment_backup_failure()
             return False, f"Google Sheets 백업 중 오류 발생: {e}"
@@ -3,6 +3,7 @@
 기존 Excel 기반 저장 방식에서 SQLite 데이터베이스를 사용하도록 변경합니다.
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 
@@ -16,15 +17,34 @@ from models.lot_manager import LotManager
 from utils.logger import logger
 
 
+def _text_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """문자열 컬럼을 앞뒤 공백 없이 반환합니다 (없거나 빈 셀은 빈 문자열)."""
+    if column not in df.columns:
+        return pd.Series('', index=df.index, dtype=object)
+    return df[column].fillna('').astype(str).str.strip()
+
+
+def _number_column(df: pd.DataFrame, column: str) -> pd.Series:
+    """숫자 컬럼을 반환합니다 (없거나 숫자가 아닌 셀은 0)."""
+    if column not in df.columns:
+        return pd.Series(0, index=df.index)
+    return pd.to_numeric(df[column], errors='coerce').fillna(0)
+
+
 class DataManager:
     """데이터 관리 클래스 (DB 기반)"""
 
     def __init__(self):
         self.db_manager = DatabaseManager()
-        self.lot_manager = LotManager(LOT_FILE)
+        # 레시피 Excel과 LOT 출고 Excel은 서로 독립적이므로 읽기(압축 해제/파일 I/O)를 겹쳐서 시작 시간을 줄임
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="recipe-load") as loader:
+            recipes_future = loader.submit(self._load_recipes_from_excel)
+            self.lot_manager = LotManager(LOT_FILE)
+            self.recipes = recipes_future.result()
         self.google_sheets_config = GoogleSheetsConfig()
         self.google_sheets_backup = GoogleSheetsBackup(self.google_sheets_config)
-        self.recipes = self._load_recipes_from_excel()
+        # 구글 시트 백업은 네트워크 호출이므로 저장 흐름을 막지 않도록 전용 스레드 1개에서 순차 실행
+        self._backup_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gsheets-backup")
 
     def _load_recipes_from_excel(self) -> Dict:
         """
@@ -40,17 +60,17 @@ class DataManager:
                     '품목명': str,
                 }
                 df = pd.read_excel(RECIPE_FILE, engine='openpyxl', dtype=dtype_spec)
-                for _, row in df.iterrows():
-                    recipe_name = str(row.get('레시피', '')).strip()
-                    if not recipe_name:
-                        continue
-                    
-                    recipes.setdefault(recipe_name, []).append({
-                        '품목코드': str(row.get('품목코드', '')).strip(),
-                        '품목명': str(row.get('품목명', '')).strip(),
-                        '배합비율': float(row.get('배합비율', 0.0) or 0.0),
-                        '순서': int(row.get('순서', 0) or 0),
-                    })
+                # 행 단위 반복 대신 컬럼 단위로 정리한 뒤 레시피별로 한 번에 묶음 (파일 내 순서 유지)
+                rows = pd.DataFrame({
+                    '레시피': _text_column(df, '레시피'),
+                    '품목코드': _text_column(df, '품목코드'),
+                    '품목명': _text_column(df, '품목명'),
+                    '배합비율': _number_column(df, '배합비율').astype(float),
+                    '순서': _number_column(df, '순서').astype(int),
+                })
+                rows = rows[rows['레시피'] != '']
+                for recipe_name, group in rows.groupby('레시피', sort=False):
+                    recipes[recipe_name] = group.drop(columns='레시피').to_dict('records')
             logger.info(f"Excel에서 레시피 로드 완료: {len(recipes)}종")
             return recipes
         except Exception as e:
@@ -69,27 +89,9 @@ class DataManager:
         base_lot = f"{recipe_name}{date_str}"
 
         try:
-            # 해당 날짜로 생성된 동일 레시피의 모든 기록을 조회
-            today_records = self.db_manager.get_mixing_records(
-                start_date=target_date.strftime("%Y-%m-%d"),
-                recipe_name=recipe_name,
-                limit=1000 # 하루에 1000개 이상은 생성하지 않는다고 가정
-            )
-            
-            # LOT 번호에서 시퀀스 부분만 추출하여 가장 큰 번호를 찾음
-            max_seq = 0
-            for record in today_records:
-                lot = record['product_lot']
-                if lot.startswith(base_lot):
-                    try:
-                        seq = int(lot[len(base_lot):])
-                        if seq > max_seq:
-                            max_seq = seq
-                    except (ValueError, IndexError):
-                        continue
-            
-            new_seq = max_seq + 1
-            return f"{base_lot}{new_seq:02d}"
+            # 시퀀스 최댓값은 DHR LOT와 같은 SQL 집계로 계산 (당일 기록을 읽어 파싱하지 않음)
+            max_seq = self.db_manager.get_max_lot_sequence(recipe_name, work_date, base_lot)
+            return f"{base_lot}{max_seq + 1:02d}"
         except Exception as e:
             logger.error(f"DB 기반 LOT 번호 생성 실패: {e}. 기본값으로 대체합니다.")
             return f"{base_lot}01"
@@ -122,7 +124,7 @@ class DataManager:
         return details_data
 
     def _backup_to_google_sheets(self, record_data: Dict, details: List[Dict]) -> None:
-        """Auto-backup mixing records to Google Sheets."""
+        """Queue auto-backup of mixing records to Google Sheets (runs in background)."""
         if not (self.google_sheets_config.is_backup_enabled() and
                 self.google_sheets_config.is_auto_backup_on_save()):
             return
@@ -148,6 +150,13 @@ class DataManager:
                 }
                 records_for_backup.append(combined_record)
 
+            self._backup_executor.submit(self._run_google_sheets_backup, records_for_backup)
+        except Exception as e:
+            logger.error(f"Google Sheets auto-backup error: {e}")
+
+    def _run_google_sheets_backup(self, records_for_backup: List[Dict]) -> None:
+        """Upload backup rows to Google Sheets (backup worker thread)."""
+        try:
             success, msg = self.google_sheets_backup.backup_records(records_for_backup)
             if success:
                 logger.info(f"Google Sheets auto-backup success: {msg}")
@@ -284,22 +293,22 @@ class DataManager:
     
     def get_mixing_records(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
                            worker: Optional[str] = None, recipe_name: Optional[str] = None,
-                           limit: int = 100) -> List[Dict]:
+                           keyword: Optional[str] = None, limit: int = 100,
+                           offset: int = 0) -> List[Dict]:
         """배합 기록을 조건 조회합니다."""
         return self.db_manager.get_mixing_records(
             start_date=start_date, end_date=end_date,
-            worker=worker, recipe_name=recipe_name, limit=limit
+            worker=worker, recipe_name=recipe_name, keyword=keyword,
+            limit=limit, offset=offset
         )
 
-    def get_all_records_df(self) -> pd.DataFrame:
-        """모든 배합 기록을 DataFrame으로 반환합니다 (단일 JOIN 쿼리)."""
+    def get_record_df_by_lot(self, product_lot: str) -> pd.DataFrame:
+        """제품 LOT 하나의 기록+상세를 DataFrame으로 반환합니다 (LOT 조건 JOIN 쿼리)."""
         try:
-            rows = self.db_manager.get_all_records_with_details(limit=10000)
-            if not rows:
-                return pd.DataFrame()
-            return pd.DataFrame(rows)
+            columns, rows = self.db_manager.get_records_with_details_table(product_lot=product_lot)
+            return pd.DataFrame.from_records(rows, columns=columns)
         except Exception as e:
-            logger.error(f"모든 기록 조회 실패: {e}")
+            logger.error(f"LOT 기록 조회 실패: {e}")
             return pd.DataFrame()
 
     def delete_record(self, product_lot: str) -> bool:
@@ -348,16 +357,9 @@ class DataManager:
             if not success:
                 return False
             
-            # 2. 상세 정보 업데이트
-            for material in materials:
-                self.db_manager.update_mixing_detail(
-                    record_id=record_id,
-                    material_code=material['material_code'],
-                    material_lot=material.get('material_lot', ''),
-                    ratio=material.get('ratio', 0),
-                    theory_amount=material.get('theory_amount', 0),
-                    actual_amount=material.get('actual_amount', 0)
-                )
+            # 2. 상세 정보 일괄 업데이트
+            if not self.db_manager.update_mixing_details(record_id, materials):
+                return False
             
             logger.info(f"배합 기록 수정 완료: LOT {product_lot}")
             return True
@@ -388,7 +390,7 @@ class DataManager:
                 'materials': [dict(d) for d in details]
             }
 
-            signature_cfg = config.get('signature', {})
+            signature_cfg = config.get_view('signature', {})
             pdf_file = self._generate_report_files(
                 export_data, record['worker'], signature_cfg,
                 effects_params, include_work_time
@@ -6,11 +6,50 @@ import os
 import sqlite3
 from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from config.settings import DB_FILE, LEGACY_DB_PATH, USER_DATA_DIR
 from utils.logger import logger
 from utils.error_handler import DatabaseError, handle_exceptions
+from utils.db_connection import ThreadLocalConnection
+from utils.sql_helpers import Condition, build_where_clause, escape_like, max_lot_sequence
+
+# 총 배합 건수 / 최근 7일 배합 건수 / 활성 레시피 수
+_STATISTICS_SELECT = """
+    SELECT
+        (SELECT COUNT(*) FROM mixing_records) AS total_records,
+        (SELECT COUNT(*) FROM mixing_records
+         WHERE work_date >= date('now', '-7 days')) AS recent_records,
+        (SELECT COUNT(DISTINCT recipe_name) FROM recipes WHERE is_active = 1) AS recipe_count
+"""
+
+# 배합 기록 페이지 조회 ({where}만 호출마다 채움)
+# id 순서 = 저장 순서 (같은 초에 저장된 건도 순서 고정, 별도 정렬 불필요)
+_MIXING_RECORDS_PAGE_SQL = """
+    SELECT * FROM mixing_records
+    WHERE {where}
+    ORDER BY id DESC
+    LIMIT ? OFFSET ?
+"""
+
+# 배합 기록 + 상세 JOIN 조회 ({where}만 호출마다 채움)
+# LIMIT은 기록 서브쿼리에 적용: 최근 기록부터 필요한 건수만 읽고 멈추며, 기록의 상세가 중간에 잘리지 않음
+_RECORD_WITH_DETAILS_SQL = """
+    SELECT r.id, r.product_lot, r.recipe_name, r.worker,
+           r.work_date, r.work_time, r.total_amount, r.scale,
+           r.created_at, r.updated_at,
+           d.material_code, d.material_name, d.material_lot,
+           d.ratio, d.theory_amount, d.actual_amount,
+           d.sequence_order
+    FROM (
+        SELECT * FROM mixing_records r
+        WHERE {where}
+        ORDER BY r.id DESC
+        LIMIT ?
+    ) r
+    JOIN mixing_details d ON d.mixing_record_id = r.id
+    ORDER BY r.id DESC, d.sequence_order
+"""
 
 
 class DatabaseManager:
@@ -21,6 +60,11 @@ class DatabaseManager:
             db_path = DB_FILE
         
         self.db_path = db_path
+        self._connections = ThreadLocalConnection(db_path)
+        self._fts_enabled = False
+        # 집계 조회 캐시: DB 변경 지문이 같을 때만 재사용 (저장/수정/삭제 시 자동 무효화)
+        self._aggregate_cache: Dict[tuple, object] = {}
+        self._aggregate_fingerprint: Optional[tuple] = None
         self._ensure_database_exists()
         self._migrate_legacy_db()
         self._create_tables()
@@ -51,21 +95,43 @@ class DatabaseManager:
     
     @contextmanager
     def get_connection(self):
-        """데이터베이스 연결 컨텍스트 매니저"""
-        conn = None
+        """데이터베이스 연결 컨텍스트 매니저 (스레드별 연결 재사용)"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.execute("PRAGMA foreign_keys = ON")
-            conn.row_factory = sqlite3.Row  # 딕셔너리 형태로 결과 반환
-            yield conn
+            # 커밋되지 않은 변경은 블록이 끝날 때 롤백됨
+            with self._connections.connection() as conn:
+                yield conn
         except sqlite3.Error as e:
-            if conn:
-                conn.rollback()
             logger.error(f"데이터베이스 오류: {e}")
             raise DatabaseError(f"데이터베이스 연결 오류: {e}")
-        finally:
-            if conn:
-                conn.close()
+
+    def close(self):
+        """열어 둔 데이터베이스 연결을 모두 닫습니다."""
+        self._connections.close()
+        self._aggregate_cache.clear()
+        self._aggregate_fingerprint = None
+
+    @staticmethod
+    def _data_fingerprint(conn: sqlite3.Connection) -> tuple:
+        """DB 내용이 바뀌었는지 판별하는 지문을 반환합니다.
+
+        data_version은 다른 연결의 커밋을, total_changes는 이 연결의 변경을 반영합니다.
+        두 값 모두 연결별이므로 연결 식별자를 함께 둡니다.
+        """
+        data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+        return (id(conn), data_version, conn.total_changes)
+
+    def _cached_aggregate(self, conn: sqlite3.Connection, key: tuple, compute):
+        """DB가 바뀌지 않았으면 이전 집계 결과를, 아니면 새로 계산한 결과를 반환합니다."""
+        if conn.in_transaction:
+            # 롤백될 수 있는 미커밋 변경이 보이는 상태의 결과는 캐시하지 않음
+            return compute()
+        fingerprint = self._data_fingerprint(conn)
+        if fingerprint != self._aggregate_fingerprint:
+            self._aggregate_cache.clear()
+            self._aggregate_fingerprint = fingerprint
+        if key not in self._aggregate_cache:
+            self._aggregate_cache[key] = compute()
+        return self._aggregate_cache[key]
     
     @handle_exceptions(user_message="데이터베이스 테이블 생성 중 오류가 발생했습니다.")
     def _create_tables(self):
@@ -124,10 +190,155 @@ class DatabaseManager:
             conn.execute("CREATE INDEX IF NOT EXISTS idx_mixing_records_date ON mixing_records(work_date)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_mixing_records_lot ON mixing_records(product_lot)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_recipes_name ON recipes(recipe_name)")
+            # 상세 조회(기록 ID + 순서 정렬)와 레시피/작업자별 기간 조회용 복합 인덱스
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_mixing_details_record ON mixing_details(mixing_record_id, sequence_order)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_mixing_records_recipe_date ON mixing_records(recipe_name, work_date)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_mixing_records_worker_date ON mixing_records(worker, work_date)")
+
+            self._fts_enabled = self._create_search_index(conn)
+            self._create_material_totals(conn)
             
             conn.commit()
+            # 새 인덱스에 필요한 통계만 갱신 (플래너가 복합 인덱스를 고르도록)
+            conn.execute("PRAGMA optimize")
             logger.debug("데이터베이스 테이블 생성/확인 완료")
     
+    def _create_search_index(self, conn) -> bool:
+        """
+        제품LOT/레시피/작업자 키워드 검색용 FTS5(trigram) 인덱스를 생성합니다.
+        SQLite 빌드에 FTS5 또는 trigram 토크나이저가 없으면 False를 반환하고 LIKE 검색을 사용합니다.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'mixing_records_fts'"
+        ).fetchone()
+        try:
+            conn.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS mixing_records_fts USING fts5(
+                    product_lot, recipe_name, worker,
+                    content='mixing_records', content_rowid='id', tokenize='trigram'
+                )
+            """)
+        except sqlite3.OperationalError as e:
+            logger.warning(f"FTS5 검색 인덱스를 사용할 수 없어 LIKE 검색으로 대체합니다: {e}")
+            return False
+
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS mixing_records_fts_ai AFTER INSERT ON mixing_records BEGIN
+                INSERT INTO mixing_records_fts (rowid, product_lot, recipe_name, worker)
+                VALUES (new.id, new.product_lot, new.recipe_name, new.worker);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS mixing_records_fts_ad AFTER DELETE ON mixing_records BEGIN
+                INSERT INTO mixing_records_fts (mixing_records_fts, rowid, product_lot, recipe_name, worker)
+                VALUES ('delete', old.id, old.product_lot, old.recipe_name, old.worker);
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS mixing_records_fts_au
+            AFTER UPDATE OF product_lot, recipe_name, worker ON mixing_records BEGIN
+                INSERT INTO mixing_records_fts (mixing_records_fts, rowid, product_lot, recipe_name, worker)
+                VALUES ('delete', old.id, old.product_lot, old.recipe_name, old.worker);
+                INSERT INTO mixing_records_fts (rowid, product_lot, recipe_name, worker)
+                VALUES (new.id, new.product_lot, new.recipe_name, new.worker);
+            END
+        """)
+
+        if not exists:
+            # 기존 DB에 인덱스를 새로 만든 경우 기존 기록을 한 번 색인
+            conn.execute("INSERT INTO mixing_records_fts (mixing_records_fts) VALUES ('rebuild')")
+            logger.info("배합 기록 검색 인덱스(FTS5) 생성 완료")
+        return True
+
+    def _create_material_totals(self, conn) -> None:
+        """
+        품목별 일자 배합량 집계 테이블을 생성합니다.
+        mixing_details 변경 시 트리거로 증분 갱신되어 집계 조회가 상세 테이블을 다시 스캔하지 않습니다.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'mixing_material_daily_totals'"
+        ).fetchone()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS mixing_material_daily_totals (
+                material_name TEXT NOT NULL,
+                work_date TEXT NOT NULL,
+                total_amount REAL NOT NULL,
+                detail_count INTEGER NOT NULL,
+                PRIMARY KEY (material_name, work_date)
+            ) WITHOUT ROWID
+        """)
+
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS mixing_totals_detail_ai AFTER INSERT ON mixing_details BEGIN
+                INSERT INTO mixing_material_daily_totals (material_name, work_date, total_amount, detail_count)
+                SELECT new.material_name, r.work_date, new.actual_amount, 1
+                FROM mixing_records r WHERE r.id = new.mixing_record_id
+                ON CONFLICT (material_name, work_date) DO UPDATE SET
+                    total_amount = total_amount + excluded.total_amount,
+                    detail_count = detail_count + 1;
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS mixing_totals_detail_ad AFTER DELETE ON mixing_details BEGIN
+                UPDATE mixing_material_daily_totals
+                SET total_amount = total_amount - old.actual_amount, detail_count = detail_count - 1
+                WHERE material_name = old.material_name
+                  AND work_date = (SELECT work_date FROM mixing_records WHERE id = old.mixing_record_id);
+                DELETE FROM mixing_material_daily_totals WHERE detail_count <= 0;
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS mixing_totals_detail_au
+            AFTER UPDATE OF material_name, actual_amount ON mixing_details BEGIN
+                UPDATE mixing_material_daily_totals
+                SET total_amount = total_amount - old.actual_amount, detail_count = detail_count - 1
+                WHERE material_name = old.material_name
+                  AND work_date = (SELECT work_date FROM mixing_records WHERE id = old.mixing_record_id);
+                INSERT INTO mixing_material_daily_totals (material_name, work_date, total_amount, detail_count)
+                SELECT new.material_name, r.work_date, new.actual_amount, 1
+                FROM mixing_records r WHERE r.id = new.mixing_record_id
+                ON CONFLICT (material_name, work_date) DO UPDATE SET
+                    total_amount = total_amount + excluded.total_amount,
+                    detail_count = detail_count + 1;
+                DELETE FROM mixing_material_daily_totals WHERE detail_count <= 0;
+            END
+        """)
+        conn.execute("""
+            CREATE TRIGGER IF NOT EXISTS mixing_totals_record_date_au
+            AFTER UPDATE OF work_date ON mixing_records BEGIN
+                UPDATE mixing_material_daily_totals
+                SET total_amount = total_amount - (
+                        SELECT SUM(d.actual_amount) FROM mixing_details d
+                        WHERE d.mixing_record_id = new.id
+                          AND d.material_name = mixing_material_daily_totals.material_name),
+                    detail_count = detail_count - (
+                        SELECT COUNT(*) FROM mixing_details d
+                        WHERE d.mixing_record_id = new.id
+                          AND d.material_name = mixing_material_daily_totals.material_name)
+                WHERE work_date = old.work_date
+                  AND material_name IN (SELECT material_name FROM mixing_details WHERE mixing_record_id = new.id);
+                INSERT INTO mixing_material_daily_totals (material_name, work_date, total_amount, detail_count)
+                SELECT material_name, new.work_date, SUM(actual_amount), COUNT(*)
+                FROM mixing_details WHERE mixing_record_id = new.id
+                GROUP BY material_name
+                ON CONFLICT (material_name, work_date) DO UPDATE SET
+                    total_amount = total_amount + excluded.total_amount,
+                    detail_count = detail_count + excluded.detail_count;
+                DELETE FROM mixing_material_daily_totals WHERE detail_count <= 0;
+            END
+        """)
+
+        if not exists:
+            # 기존 DB에 집계 테이블을 새로 만든 경우 기존 상세 기록으로 한 번 채움
+            conn.execute("""
+                INSERT INTO mixing_material_daily_totals (material_name, work_date, total_amount, detail_count)
+                SELECT d.material_name, r.work_date, SUM(d.actual_amount), COUNT(*)
+                FROM mixing_details d
+                JOIN mixing_records r ON d.mixing_record_id = r.id
+                GROUP BY d.material_name, r.work_date
+            """)
+            logger.info("품목별 일자 배합량 집계 테이블 생성 완료")
+
     @handle_exceptions(user_message="배합 기록 저장 중 오류가 발생했습니다.")
     def save_mixing_record(self, record_data: Dict, details: List[Dict]) -> int:
         """
@@ -158,14 +369,14 @@ class DatabaseManager:
             
             record_id = cursor.lastrowid
             
-            # 상세 기록 저장
-            for i, detail in enumerate(details):
-                conn.execute("""
-                    INSERT INTO mixing_details 
-                    (mixing_record_id, material_code, material_name, material_lot, 
-                     ratio, theory_amount, actual_amount, sequence_order)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+            # 상세 기록 저장 (단일 prepared statement로 일괄 삽입)
+            conn.executemany("""
+                INSERT INTO mixing_details 
+                (mixing_record_id, material_code, material_name, material_lot, 
+                 ratio, theory_amount, actual_amount, sequence_order)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (
                     record_id,
                     detail['material_code'],
                     detail['material_name'],
@@ -174,7 +385,9 @@ class DatabaseManager:
                     detail['theory_amount'],
                     detail['actual_amount'],
                     i + 1
-                ))
+                )
+                for i, detail in enumerate(details)
+            ])
             
             conn.commit()
             logger.log_mixing_operation(
@@ -193,7 +406,9 @@ class DatabaseManager:
                           end_date: Optional[str] = None,
                           worker: Optional[str] = None,
                           recipe_name: Optional[str] = None,
-                          limit: int = 100) -> List[Dict]:
+                          keyword: Optional[str] = None,
+                          limit: int = 100,
+                          offset: int = 0) -> List[Dict]:
         """
         배합 기록을 조회합니다.
         
@@ -202,40 +417,45 @@ class DatabaseManager:
             end_date: 종료 날짜 (YYYY-MM-DD)
             worker: 작업자명
             recipe_name: 레시피명
+            keyword: 제품LOT/레시피/작업자 부분 일치 검색어
             limit: 최대 조회 건수
+            offset: 건너뛸 건수 (페이지 조회용)
         
         Returns:
             배합 기록 리스트
         """
+        where, params = build_where_clause([
+            ("work_date >= ?", start_date),
+            ("work_date <= ?", end_date),
+            ("worker = ?", worker),
+            ("recipe_name = ?", recipe_name),
+            self._keyword_condition(keyword),
+        ])
         with self.get_connection() as conn:
-            query = "SELECT * FROM mixing_records WHERE 1=1"
-            params = []
-            
-            if start_date:
-                query += " AND work_date >= ?"
-                params.append(start_date)
-            
-            if end_date:
-                query += " AND work_date <= ?"
-                params.append(end_date)
-            
-            if worker:
-                query += " AND worker = ?"
-                params.append(worker)
-            
-            if recipe_name:
-                query += " AND recipe_name = ?"
-                params.append(recipe_name)
-            
-            query += " ORDER BY created_at DESC LIMIT ?"
-            params.append(limit)
-            
-            cursor = conn.execute(query, params)
+            params.extend([limit, offset])
+            cursor = conn.execute(_MIXING_RECORDS_PAGE_SQL.format(where=where), params)
             records = [dict(row) for row in cursor.fetchall()]
             
             logger.debug(f"배합 기록 조회: {len(records)}건")
             return records
     
+    def _keyword_condition(self, keyword: Optional[str]) -> Condition:
+        """키워드 검색 조건 (3글자 이상은 FTS 인덱스, 그 외는 LIKE)"""
+        keyword = (keyword or "").strip()
+        if not keyword:
+            return ("", None)
+        if self._fts_enabled and len(keyword) >= 3:
+            # trigram 인덱스는 3글자 이상 검색어만 색인 조회가 가능
+            return (
+                "id IN (SELECT rowid FROM mixing_records_fts WHERE mixing_records_fts MATCH ?)",
+                '"' + keyword.replace('"', '""') + '"',
+            )
+        pattern = escape_like(keyword)
+        return (
+            "(product_lot LIKE ? ESCAPE '\\' OR recipe_name LIKE ? ESCAPE '\\' OR worker LIKE ? ESCAPE '\\')",
+            (pattern, pattern, pattern),
+        )
+
     @handle_exceptions(user_message="배합 상세 정보 조회 중 오류가 발생했습니다.", default_return=[])
     def get_mixing_details(self, mixing_record_id: int) -> List[Dict]:
         """특정 배합 기록의 상세 정보를 조회합니다."""
@@ -261,18 +481,20 @@ class DatabaseManager:
             """, (recipe_name,))
             
             # 새 레시피 저장
-            for i, material in enumerate(materials):
-                conn.execute("""
-                    INSERT OR REPLACE INTO recipes 
-                    (recipe_name, material_code, material_name, ratio, sequence_order)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
+            conn.executemany("""
+                INSERT OR REPLACE INTO recipes 
+                (recipe_name, material_code, material_name, ratio, sequence_order)
+                VALUES (?, ?, ?, ?, ?)
+            """, [
+                (
                     recipe_name,
                     material['품목코드'],
                     material['품목명'],
                     material['배합비율'],
                     i + 1
-                ))
+                )
+                for i, material in enumerate(materials)
+            ])
             
             conn.commit()
             logger.info(f"레시피 저장 완료: {recipe_name}, {len(materials)}개 재료")
@@ -312,33 +534,26 @@ class DatabaseManager:
             os.makedirs(backup_dir, exist_ok=True)
             backup_path = os.path.join(backup_dir, f"mixing_records_backup_{timestamp}.db")
         
-        import shutil
-        shutil.copy2(self.db_path, backup_path)
+        # WAL 파일에만 있는 최근 변경까지 포함되도록 파일 복사 대신 SQLite 백업 API 사용
+        with self.get_connection() as conn:
+            target = sqlite3.connect(backup_path)
+            try:
+                conn.backup(target)
+            finally:
+                target.close()
         logger.info(f"데이터베이스 백업 완료: {backup_path}")
         return backup_path
     
     def get_statistics(self) -> Dict:
         """간단한 통계 정보를 반환합니다."""
         with self.get_connection() as conn:
-            stats = {}
-
-            # 총 배합 건수
-            cursor = conn.execute("SELECT COUNT(*) as total_records FROM mixing_records")
-            stats['total_records'] = cursor.fetchone()['total_records']
-
-            # 최근 7일 배합 건수
-            cursor = conn.execute("""
-                SELECT COUNT(*) as recent_records
-                FROM mixing_records
-                WHERE work_date >= date('now', '-7 days')
-            """)
-            stats['recent_records'] = cursor.fetchone()['recent_records']
-
-            # 활성 레시피 수
-            cursor = conn.execute("SELECT COUNT(DISTINCT recipe_name) as recipe_count FROM recipes WHERE is_active = 1")
-            stats['recipe_count'] = cursor.fetchone()['recipe_count']
-
-            return stats
+            # 세 집계를 한 문장으로 조회 (고정 SQL이라 연결의 문장 캐시를 재사용)
+            row = conn.execute(_STATISTICS_SELECT).fetchone()
+            return {
+                'total_records': row['total_records'],
+                'recent_records': row['recent_records'],
+                'recipe_count': row['recipe_count'],
+            }
 
     @handle_exceptions(user_message="배합 기록 삭제 중 오류가 발생했습니다.")
     def delete_mixing_record(self, record_id: int) -> bool:
@@ -372,6 +587,22 @@ class DatabaseManager:
             logger.info(f"배합 기록 삭제 완료: ID {record_id}, LOT {product_lot}")
             return True
 
+    @handle_exceptions(user_message="LOT 번호 조회 중 오류가 발생했습니다.", default_return=0)
+    def get_max_lot_sequence(self, recipe_name: str, work_date: str, base_lot: str) -> int:
+        """
+        같은 날짜/레시피로 발급된 제품 LOT의 최대 시퀀스 번호를 조회합니다.
+
+        Args:
+            recipe_name: 레시피 이름
+            work_date: 작업 날짜 (YYYY-MM-DD)
+            base_lot: 시퀀스 앞부분 ({레시피}{YYMMDD})
+
+        Returns:
+            최대 시퀀스 번호 (없으면 0)
+        """
+        with self.get_connection() as conn:
+            return max_lot_sequence(conn, "mixing_records", "recipe_name", recipe_name, work_date, base_lot)
+
     @handle_exceptions(user_message="배합 기록 조회 중 오류가 발생했습니다.", default_return=None)
     def get_mixing_record_by_lot(self, product_lot: str) -> Optional[Dict]:
         """
@@ -418,37 +649,38 @@ class DatabaseManager:
                 return True
             return False
     
-    @handle_exceptions(user_message="배합 상세 정보 수정 중 오류가 발생했습니다.")
-    def update_mixing_detail(self, record_id: int, material_code: str, 
-                              material_lot: str, ratio: float, 
-                              theory_amount: float, actual_amount: float) -> bool:
+    @handle_exceptions(user_message="배합 상세 정보 수정 중 오류가 발생했습니다.", default_return=False)
+    def update_mixing_details(self, record_id: int, materials: List[Dict]) -> bool:
         """
-        배합 상세 정보를 수정합니다.
+        배합 상세 정보 여러 건을 한 트랜잭션에서 일괄 수정합니다.
 
         Args:
             record_id: 배합 기록 ID
-            material_code: 품목코드
-            material_lot: 자재 LOT
-            ratio: 배합비율
-            theory_amount: 이론계량
-            actual_amount: 실제배합
+            materials: 재료 정보 리스트 (material_code, material_lot, ratio, theory_amount, actual_amount)
 
         Returns:
             수정 성공 여부
         """
         with self.get_connection() as conn:
-            cursor = conn.execute("""
+            conn.executemany("""
                 UPDATE mixing_details 
                 SET material_lot = ?, ratio = ?, theory_amount = ?, actual_amount = ?
                 WHERE mixing_record_id = ? AND material_code = ?
-            """, (material_lot, ratio, theory_amount, actual_amount, record_id, material_code))
-            
+            """, [
+                (
+                    material.get('material_lot', ''),
+                    material.get('ratio', 0),
+                    material.get('theory_amount', 0),
+                    material.get('actual_amount', 0),
+                    record_id,
+                    material['material_code']
+                )
+                for material in materials
+            ])
+
             conn.commit()
-            
-            if cursor.rowcount > 0:
-                logger.debug(f"배합 상세 수정 완료: record_id={record_id}, material_code={material_code}")
-                return True
-            return False
+            logger.debug(f"배합 상세 일괄 수정 완료: record_id={record_id}, {len(materials)}건")
+            return True
 
     @handle_exceptions(user_message="품목별 배합량 집계 중 오류가 발생했습니다.", default_return=0.0)
     def sum_item_amount_by_date_range(self, start_date: str, end_date: str, material_name: str) -> float:
@@ -464,46 +696,52 @@ class DatabaseManager:
             총 실제 배합량
         """
         with self.get_connection() as conn:
-            query = """
-                SELECT SUM(d.actual_amount) as total
-                FROM mixing_details d
-                JOIN mixing_records r ON d.mixing_record_id = r.id
-                WHERE r.work_date BETWEEN ? AND ?
-                AND d.material_name = ?;
-            """
-            cursor = conn.execute(query, (start_date, end_date, material_name))
-            result = cursor.fetchone()
-            
-            total = result['total'] if result and result['total'] is not None else 0.0
+            def compute():
+                # 트리거로 유지되는 일자별 집계 테이블에서 (품목, 일자) 범위만 합산
+                query = """
+                    SELECT SUM(total_amount) as total
+                    FROM mixing_material_daily_totals
+                    WHERE material_name = ?
+                    AND work_date BETWEEN ? AND ?;
+                """
+                result = conn.execute(query, (material_name, start_date, end_date)).fetchone()
+                return result['total'] if result and result['total'] is not None else 0.0
+
+            total = self._cached_aggregate(conn, ('item_total', material_name, start_date, end_date), compute)
             logger.debug(f"'{material_name}'의 총 배합량 집계 ({start_date}~{end_date}): {total}")
             return total
 
-    @handle_exceptions(user_message="배합 기록 전체 조회 중 오류가 발생했습니다.", default_return=[])
-    def get_all_records_with_details(self, limit: int = 10000) -> List[Dict]:
-        """모든 배합 기록과 상세 정보를 JOIN으로 한 번에 조회합니다."""
+    @handle_exceptions(user_message="배합 기록 상세 조회 중 오류가 발생했습니다.", default_return=([], []))
+    def get_records_with_details_table(self, product_lot: Optional[str] = None,
+                                       limit: int = 10000) -> Tuple[List[str], List[tuple]]:
+        """
+        배합 기록과 상세 정보를 JOIN으로 조회하여 (컬럼명 리스트, 튜플 행 리스트)로 반환합니다.
+        행을 dict로 변환하지 않으므로 DataFrame.from_records에 바로 넘길 수 있습니다.
+
+        Args:
+            product_lot: 지정 시 해당 LOT만 조회, 미지정 시 최근 기록부터 전체 조회
+            limit: 최대 조회 기록 수 (각 기록의 상세 행은 모두 포함)
+        """
+        where, params = build_where_clause([("r.product_lot = ?", product_lot)])
         with self.get_connection() as conn:
-            cursor = conn.execute("""
-                SELECT r.id, r.product_lot, r.recipe_name, r.worker,
-                       r.work_date, r.work_time, r.total_amount, r.scale,
-                       r.created_at, r.updated_at,
-                       d.material_code, d.material_name, d.material_lot,
-                       d.ratio, d.theory_amount, d.actual_amount,
-                       d.sequence_order
-                FROM mixing_records r
-                JOIN mixing_details d ON d.mixing_record_id = r.id
-                ORDER BY r.created_at DESC, d.sequence_order
-                LIMIT ?
-            """, (limit,))
-            results = [dict(row) for row in cursor.fetchall()]
-            logger.debug(f"배합 기록+상세 일괄 조회: {len(results)}건")
-            return results
+            cursor = conn.cursor()
+            cursor.row_factory = None  # sqlite3.Row 대신 기본 튜플 사용
+            cursor.execute(_RECORD_WITH_DETAILS_SQL.format(where=where), params + [limit])
+            rows = cursor.fetchall()
+            columns = [col[0] for col in cursor.description]
+            logger.debug(f"배합 기록+상세 조회: {len(rows)}건")
+            return columns, rows
 
     @handle_exceptions(user_message="전체 품목명 조회 중 오류가 발생했습니다.", default_return=[])
     def get_all_material_names(self) -> List[str]:
         """데이터베이스에 기록된 모든 고유 품목명을 조회합니다."""
         with self.get_connection() as conn:
-            query = "SELECT DISTINCT material_name FROM mixing_details ORDER BY material_name;"
-            cursor = conn.execute(query)
-            names = [row['material_name'] for row in cursor.fetchall()]
+            def compute():
+                # 상세 전체 대신 (품목, 일자) 집계 테이블의 기본키 순서로 읽음 (정렬 불필요)
+                query = "SELECT DISTINCT material_name FROM mixing_material_daily_totals ORDER BY material_name;"
+                return [row['material_name'] for row in conn.execute(query).fetchall()]
+
+            # 호출자가 목록을 수정해도 캐시가 오염되지 않도록 복사본 반환
+            names = list(self._cached_aggregate(conn, ('material_names',), compute))
             logger.debug(f"전체 고유 품목명 조회: {len(names)}건")
             return names
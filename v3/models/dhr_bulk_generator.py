@@ -11,6 +11,8 @@ class DhrBulkGenerator:
         self.dhr_db = dhr_db
         self.lot_manager = lot_manager
         self.last_export_failures: List[str] = []
+        # 한 번의 generate 동안 공유하는 (exporter, 서명 이미지 처리기) - 첫 출력 시 생성
+        self._export_tools = None
 
     def _validate_material_lots_for_date(self, work_date: str, materials: List[Dict]):
         missing = []
@@ -25,23 +27,9 @@ class DhrBulkGenerator:
         return (len(missing) == 0), missing, lot_map
 
     def _get_base_time_for_date(self, product_name: str, work_date: str):
-        records = self.dhr_db.get_dhr_records(start_date=work_date, end_date=work_date, limit=1000)
-        latest = None
-        for r in records:
-            if r.get("product_name") != product_name:
-                continue
-            wt = (r.get("work_time") or "").strip()
-            if not wt:
-                continue
-            try:
-                t = datetime.strptime(wt, "%H:%M:%S").time()
-                if latest is None or t > latest:
-                    latest = t
-            except ValueError:
-                continue
-
+        latest = self.dhr_db.get_latest_work_time(product_name, work_date)
         if latest:
-            return datetime.strptime(f"{work_date} {latest.strftime('%H:%M:%S')}", "%Y-%m-%d %H:%M:%S")
+            return datetime.strptime(f"{work_date} {latest}", "%Y-%m-%d %H:%M:%S")
 
         base_minute = random.randint(0, 59)
         return datetime.strptime(f"{work_date} 09:{base_minute:02d}:00", "%Y-%m-%d %H:%M:%S")
@@ -49,13 +37,11 @@ class DhrBulkGenerator:
     def generate(self, entries: List[Dict], product_name: str, materials: List[Dict], worker: str,
                  include_time: bool, scan_effects: Dict, signature_options: Dict, export: bool = True) -> int:
         self.last_export_failures = []
+        self._export_tools = None
         if not entries:
             return 0
 
-        unique_dates = []
-        for e in entries:
-            if e["date"] not in unique_dates:
-                unique_dates.append(e["date"])
+        unique_dates = list(dict.fromkeys(e["date"] for e in entries))
 
         lot_map_by_date = {}
         for d in unique_dates:
@@ -129,6 +115,29 @@ class DhrBulkGenerator:
 
         return success_count
 
+    def _get_export_tools(self, signature_options: Dict):
+        """출력기와 서명 이미지 처리기를 generate 호출당 한 번만 만듭니다.
+
+        레코드마다 설정 복사/폴더 확인을 반복하지 않고, 처리기의 직전 서명 기록도 이어서 사용합니다.
+        """
+        if self._export_tools is None:
+            from models.excel_exporter import ExcelExporter
+            from models.image_processor import ImageProcessor
+            import os
+
+            exporter = ExcelExporter()
+
+            base_dir = os.path.dirname(os.path.dirname(__file__))
+            resources_path = os.path.join(base_dir, "resources", "signature")
+
+            signature_cfg = config.get("signature", {})
+            if signature_options:
+                signature_cfg["include"] = signature_options
+
+            img_processor = ImageProcessor(resources_path=resources_path, config=signature_cfg)
+            self._export_tools = (exporter, img_processor)
+        return self._export_tools
+
     def _export_record(
         self,
         product_lot: str,
@@ -142,24 +151,15 @@ class DhrBulkGenerator:
         scan_effects: Dict,
         signature_options: Dict,
     ) -> None:
-        from models.excel_exporter import ExcelExporter
-        from models.image_processor import ImageProcessor
         import os
 
         signed_image_path = None
         image_to_embed = None
         try:
-            exporter = ExcelExporter()
+            exporter, img_processor = self._get_export_tools(signature_options)
 
             base_dir = os.path.dirname(os.path.dirname(__file__))
-            resources_path = os.path.join(base_dir, "resources", "signature")
-            base_image_path = os.path.join(resources_path, "image.jpeg")
-
-            signature_cfg = config.get("signature", {})
-            if signature_options:
-                signature_cfg["include"] = signature_options
-
-            img_processor = ImageProcessor(resources_path=resources_path, config=signature_cfg)
+            base_image_path = os.path.join(img_processor.resources_path, "image.jpeg")
             signed_image_path = os.path.join(base_dir, "resources", f"temp_signed_{worker}.png")
 
             if os.path.exists(base_image_path):
@@ -12,11 +12,18 @@ from typing import Dict, List, Optional
 from config.settings import USER_DATA_DIR
 from utils.logger import logger
 from utils.error_handler import DatabaseError, handle_exceptions
+from utils.db_connection import ThreadLocalConnection
+from utils.sql_helpers import build_where_clause, max_lot_sequence
 
 
 # DHR 전용 DB 파일 경로
 DHR_DB_FILE = os.path.join(USER_DATA_DIR, "dhr_records.db")
 
+# 조건 조회 SQL ({where}만 호출마다 채움)
+# id 순서 = 저장 순서 (같은 초에 저장된 건도 순서 고정, 별도 정렬 불필요)
+_DHR_RECORDS_PAGE_SQL = "SELECT * FROM dhr_records WHERE {where} ORDER BY id DESC LIMIT ?"
+_DHR_RECIPES_SQL = "SELECT * FROM dhr_recipes WHERE {where} ORDER BY recipe_name"
+
 
 class DhrDatabaseManager:
     """DHR 전용 데이터베이스 관리 클래스"""
@@ -26,6 +33,7 @@ class DhrDatabaseManager:
             db_path = DHR_DB_FILE
         
         self.db_path = db_path
+        self._connections = ThreadLocalConnection(db_path)
         self._ensure_database_exists()
         self._create_tables()
         logger.info(f"DHR 데이터베이스 초기화 완료: {self.db_path}")
@@ -37,21 +45,18 @@ class DhrDatabaseManager:
     
     @contextmanager
     def get_connection(self):
-        """데이터베이스 연결 컨텍스트 매니저"""
-        conn = None
+        """데이터베이스 연결 컨텍스트 매니저 (스레드별 연결 재사용)"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            conn.execute("PRAGMA foreign_keys = ON")
-            conn.row_factory = sqlite3.Row
-            yield conn
+            # 커밋되지 않은 변경은 블록이 끝날 때 롤백됨
+            with self._connections.connection() as conn:
+                yield conn
         except sqlite3.Error as e:
-            if conn:
-                conn.rollback()
             logger.error(f"DHR 데이터베이스 오류: {e}")
             raise DatabaseError(f"DHR 데이터베이스 연결 오류: {e}")
-        finally:
-            if conn:
-                conn.close()
+
+    def close(self):
+        """열어 둔 데이터베이스 연결을 모두 닫습니다."""
+        self._connections.close()
     
     @handle_exceptions(user_message="DHR 테이블 생성 중 오류가 발생했습니다.")
     def _create_tables(self):
@@ -138,9 +143,15 @@ class DhrDatabaseManager:
             conn.execute("CREATE INDEX IF NOT EXISTS idx_dhr_records_lot ON dhr_records(product_lot)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_dhr_recipes_name ON dhr_recipes(recipe_name)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_dhr_categories_type ON dhr_recipe_categories(category_type)")
+            # 상세/레시피 자재 조회(부모 ID + 순서 정렬)와 제품별 일자 조회(LOT 채번, 작업시간)용 복합 인덱스
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_dhr_details_record ON dhr_details(dhr_record_id, sequence_order)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_dhr_recipe_materials_recipe ON dhr_recipe_materials(recipe_id, sequence_order)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_dhr_records_product_date ON dhr_records(product_name, work_date)")
             self._try_create_unique_lot_index(conn)
             
             conn.commit()
+            # 새 인덱스에 필요한 통계만 갱신 (플래너가 복합 인덱스를 고르도록)
+            conn.execute("PRAGMA optimize")
             logger.debug("DHR 데이터베이스 테이블 생성/확인 완료")
 
     def _try_create_unique_lot_index(self, conn) -> None:
@@ -171,21 +182,7 @@ class DhrDatabaseManager:
         target_date = datetime.strptime(work_date, "%Y-%m-%d")
         date_str = target_date.strftime("%y%m%d")
         base_lot = f"{product_name}{date_str}"
-        cursor = conn.execute(
-            "SELECT product_lot FROM dhr_records WHERE work_date = ? AND product_name = ?",
-            (work_date, product_name),
-        )
-        max_seq = 0
-        for row in cursor.fetchall():
-            lot = row["product_lot"]
-            if not lot.startswith(base_lot):
-                continue
-            try:
-                seq = int(lot[len(base_lot):])
-            except (ValueError, IndexError):
-                continue
-            if seq > max_seq:
-                max_seq = seq
+        max_seq = max_lot_sequence(conn, "dhr_records", "product_name", product_name, work_date, base_lot)
         return f"{base_lot}{max_seq + 1:02d}"
 
     def _resolve_unique_product_lot(self, conn, record_data: Dict) -> str:
@@ -250,14 +247,14 @@ class DhrDatabaseManager:
             
             record_id = cursor.lastrowid
             
-            # 상세 기록 저장
-            for i, detail in enumerate(details):
-                conn.execute("""
-                    INSERT INTO dhr_details 
-                    (dhr_record_id, material_code, material_name, material_lot, 
-                     ratio, theory_amount, actual_amount, sequence_order)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
+            # 상세 기록 저장 (단일 prepared statement로 일괄 삽입)
+            conn.executemany("""
+                INSERT INTO dhr_details 
+                (dhr_record_id, material_code, material_name, material_lot, 
+                 ratio, theory_amount, actual_amount, sequence_order)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (
                     record_id,
                     detail.get('material_code', ''),
                     detail.get('material_name', ''),
@@ -266,7 +263,9 @@ class DhrDatabaseManager:
                     detail.get('theory_amount', 0),
                     detail.get('actual_amount', 0),
                     i + 1
-                ))
+                )
+                for i, detail in enumerate(details)
+            ])
             
             conn.commit()
             logger.info(f"DHR 기록 저장 완료: LOT {record_data['product_lot']}, ID {record_id}")
@@ -280,27 +279,32 @@ class DhrDatabaseManager:
         """
         DHR 기록을 조회합니다.
         """
+        where, params = build_where_clause([
+            ("work_date >= ?", start_date),
+            ("work_date <= ?", end_date),
+        ])
         with self.get_connection() as conn:
-            query = "SELECT * FROM dhr_records WHERE 1=1"
-            params = []
-            
-            if start_date:
-                query += " AND work_date >= ?"
-                params.append(start_date)
-            
-            if end_date:
-                query += " AND work_date <= ?"
-                params.append(end_date)
-            
-            query += " ORDER BY created_at DESC LIMIT ?"
             params.append(limit)
-            
-            cursor = conn.execute(query, params)
+            cursor = conn.execute(_DHR_RECORDS_PAGE_SQL.format(where=where), params)
             records = [dict(row) for row in cursor.fetchall()]
             
             logger.debug(f"DHR 기록 조회: {len(records)}건")
             return records
     
+    @handle_exceptions(user_message="DHR 기록 조회 중 오류가 발생했습니다.", default_return=None)
+    def get_latest_work_time(self, product_name: str, work_date: str) -> Optional[str]:
+        """
+        해당 날짜/제품의 가장 늦은 작업시간(HH:MM:SS)을 조회합니다.
+        시간 형식이 아닌 값은 SQLite time()이 NULL로 처리하여 제외됩니다.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.execute("""
+                SELECT MAX(time(trim(work_time))) AS latest
+                FROM dhr_records
+                WHERE work_date = ? AND product_name = ?
+            """, (work_date, product_name))
+            return cursor.fetchone()["latest"]
+
     @handle_exceptions(user_message="DHR 상세 정보 조회 중 오류가 발생했습니다.", default_return=[])
     def get_dhr_details(self, dhr_record_id: int) -> List[Dict]:
         """특정 DHR 기록의 상세 정보를 조회합니다."""
@@ -372,6 +376,20 @@ class DhrDatabaseManager:
             """, (category_type,))
             return [row['value'] for row in cursor.fetchall()]
     
+    @handle_exceptions(user_message="분류 항목 조회 중 오류가 발생했습니다.", default_return={})
+    def get_all_categories(self) -> Dict[str, List[str]]:
+        """모든 분류 타입의 값을 한 번에 조회합니다 (타입별 값 목록)."""
+        with self.get_connection() as conn:
+            # (category_type, value) 유니크 인덱스 순서로 읽으므로 별도 정렬 없이 타입별로 묶임
+            cursor = conn.execute("""
+                SELECT category_type, value FROM dhr_recipe_categories
+                ORDER BY category_type, value
+            """)
+            categories: Dict[str, List[str]] = {}
+            for category_type, value in cursor.fetchall():
+                categories.setdefault(category_type, []).append(value)
+            return categories
+    
     @handle_exceptions(user_message="레시피 저장 중 오류가 발생했습니다.")
     def save_recipe(self, recipe_data: Dict, materials: List[Dict]) -> int:
         """DHR 레시피를 저장합니다."""
@@ -392,31 +410,32 @@ class DhrDatabaseManager:
             recipe_id = cursor.lastrowid
             
             # 자재 목록 저장
-            for i, mat in enumerate(materials):
-                conn.execute("""
-                    INSERT INTO dhr_recipe_materials 
-                    (recipe_id, material_code, material_name, ratio, sequence_order)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
+            conn.executemany("""
+                INSERT INTO dhr_recipe_materials 
+                (recipe_id, material_code, material_name, ratio, sequence_order)
+                VALUES (?, ?, ?, ?, ?)
+            """, [
+                (
                     recipe_id,
                     mat.get('material_code', ''),
                     mat.get('material_name', ''),
                     mat.get('ratio', 0),
                     i + 1
-                ))
+                )
+                for i, mat in enumerate(materials)
+            ])
             
             # 분류 마스터에 자동 추가
-            for cat_type, value in [
+            categories = [
                 ('company', recipe_data.get('company')),
                 ('product_type', recipe_data.get('product_type')),
                 ('drug', recipe_data.get('drug')),
                 ('wear_period', recipe_data.get('wear_period'))
-            ]:
-                if value:
-                    conn.execute("""
-                        INSERT OR IGNORE INTO dhr_recipe_categories (category_type, value)
-                        VALUES (?, ?)
-                    """, (cat_type, value))
+            ]
+            conn.executemany("""
+                INSERT OR IGNORE INTO dhr_recipe_categories (category_type, value)
+                VALUES (?, ?)
+            """, [(cat_type, value) for cat_type, value in categories if value])
             
             conn.commit()
             logger.info(f"DHR 레시피 저장 완료: {recipe_data['recipe_name']}, ID {recipe_id}")
@@ -426,26 +445,14 @@ class DhrDatabaseManager:
     def get_recipes(self, company: Optional[str] = None, product_type: Optional[str] = None,
                     drug: Optional[str] = None, wear_period: Optional[str] = None) -> List[Dict]:
         """조건에 맞는 레시피 목록을 조회합니다."""
+        where, params = build_where_clause([
+            ("company = ?", company),
+            ("product_type = ?", product_type),
+            ("drug = ?", drug),
+            ("wear_period = ?", wear_period),
+        ], base="is_active = 1")
         with self.get_connection() as conn:
-            query = "SELECT * FROM dhr_recipes WHERE is_active = 1"
-            params = []
-            
-            if company:
-                query += " AND company = ?"
-                params.append(company)
-            if product_type:
-                query += " AND product_type = ?"
-                params.append(product_type)
-            if drug:
-                query += " AND drug = ?"
-                params.append(drug)
-            if wear_period:
-                query += " AND wear_period = ?"
-                params.append(wear_period)
-            
-            query += " ORDER BY recipe_name"
-            
-            cursor = conn.execute(query, params)
+            cursor = conn.execute(_DHR_RECIPES_SQL.format(where=where), params)
             return [dict(row) for row in cursor.fetchall()]
     
     @handle_exceptions(user_message="레시피 자재 조회 중 오류가 발생했습니다.", default_return=[])
@@ -493,18 +500,20 @@ class DhrDatabaseManager:
             # 기존 자재 삭제 후 재삽입
             conn.execute("DELETE FROM dhr_recipe_materials WHERE recipe_id = ?", (recipe_id,))
             
-            for i, mat in enumerate(materials):
-                conn.execute("""
-                    INSERT INTO dhr_recipe_materials 
-                    (recipe_id, material_code, material_name, ratio, sequence_order)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
+            conn.executemany("""
+                INSERT INTO dhr_recipe_materials 
+                (recipe_id, material_code, material_name, ratio, sequence_order)
+                VALUES (?, ?, ?, ?, ?)
+            """, [
+                (
                     recipe_id,
                     mat.get('material_code', ''),
                     mat.get('material_name', ''),
                     mat.get('ratio', 0),
                     i + 1
-                ))
+                )
+                for i, mat in enumerate(materials)
+            ])
             
             conn.commit()
             logger.info(f"DHR 레시피 수정 완료: ID {recipe_id}")
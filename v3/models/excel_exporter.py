@@ -3,8 +3,8 @@
 배합 기록을 엑셀 파일로 출력하고, 스캔 효과를 적용하여 PDF로 변환합니다.
 """
 import os
-import shutil
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from openpyxl import load_workbook
 from openpyxl.drawing.image import Image as OpenpyxlImage
@@ -18,6 +18,11 @@ import fitz  # PyMuPDF
 from PIL import Image, ImageEnhance, ImageFilter
 import numpy as np
 
+# 표 서식 공통 스타일 (openpyxl 스타일 객체는 불변이므로 셀마다 새로 만들지 않고 공유)
+_THIN_SIDE = Side(style='thin')
+_THIN_BORDER = Border(left=_THIN_SIDE, right=_THIN_SIDE, top=_THIN_SIDE, bottom=_THIN_SIDE)
+_CENTER_ALIGNMENT = Alignment(horizontal='center', vertical='center')
+
 
 class ExcelExporter:
     """엑셀 및 PDF 출력 클래스"""
@@ -31,7 +36,8 @@ class ExcelExporter:
         for folder in [self.excel_folder, self.pdf_folder]:
             os.makedirs(folder, exist_ok=True)
 
-        self.cell_mapping = config.get("excel.cell_mapping", {})
+        # 셀 위치는 읽기만 하므로 복사하지 않은 읽기 전용 뷰 사용
+        self.cell_mapping = config.get_view("excel.cell_mapping", {})
         self.template_file = os.path.join("resources", "template.xlsx")
         logger.debug(f"ExcelExporter 초기화: excel={self.excel_folder}, pdf={self.pdf_folder}")
 
@@ -43,7 +49,6 @@ class ExcelExporter:
                 return None
 
             output_file = os.path.join(self.excel_folder, f"{data['product_lot']}.xlsx")
-            shutil.copy2(self.template_file, output_file)
 
             with warnings.catch_warnings():
                 warnings.filterwarnings(
@@ -52,7 +57,8 @@ class ExcelExporter:
                     category=UserWarning,
                     module="openpyxl",
                 )
-                wb = load_workbook(output_file)
+                # 템플릿을 직접 읽어 결과 경로로 저장 (사본 복사 후 다시 읽지 않음)
+                wb = load_workbook(self.template_file)
             ws = wb.active
 
             # 데이터 입력
@@ -97,8 +103,8 @@ class ExcelExporter:
             if not page_images:
                 raise ValueError("PDF를 이미지로 변환하는 데 실패했습니다.")
 
-            # 3. 각 이미지에 스캔 효과 적용
-            processed_images = [self._apply_scan_effects(img, effects_params) for img in page_images]
+            # 3. 각 이미지에 스캔 효과 적용 (PIL 필터/numpy 연산은 GIL을 놓으므로 페이지별 병렬 처리)
+            processed_images = self._apply_scan_effects_to_pages(page_images, effects_params)
 
             # 4. 효과 적용된 이미지 목록 -> 최종 PDF
             self._images_to_final_pdf(processed_images, final_pdf_path)
@@ -160,10 +166,15 @@ class ExcelExporter:
 
         proc_img = image.filter(ImageFilter.GaussianBlur(radius=blur))
         
-        img_array = np.array(proc_img)
-        noise_array = np.random.randint(-noise, noise, img_array.shape, dtype='int16')
-        img_array = np.clip(img_array + noise_array, 0, 255).astype('uint8')
-        proc_img = Image.fromarray(img_array)
+        if noise > 0:
+            img_array = np.asarray(proc_img)
+            # 노이즈는 가능한 한 int8(픽셀당 1바이트)로 만들고 int16 작업 배열 하나에서 제자리 연산
+            noise_dtype = np.int8 if noise <= 128 else np.int16
+            noise_array = np.random.default_rng().integers(-noise, noise, img_array.shape, dtype=noise_dtype)
+            work = img_array.astype(np.int16)
+            work += noise_array
+            np.clip(work, 0, 255, out=work)
+            proc_img = Image.fromarray(work.astype(np.uint8))
 
         enhancer = ImageEnhance.Contrast(proc_img)
         proc_img = enhancer.enhance(contrast)
@@ -173,6 +184,14 @@ class ExcelExporter:
         
         return proc_img
 
+    def _apply_scan_effects_to_pages(self, page_images, params):
+        """페이지 이미지 목록에 스캔 효과를 적용 (여러 페이지는 스레드로 병렬 처리, 순서 유지)"""
+        if len(page_images) <= 1:
+            return [self._apply_scan_effects(img, params) for img in page_images]
+        workers = min(len(page_images), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="scan-effects") as executor:
+            return list(executor.map(lambda img: self._apply_scan_effects(img, params), page_images))
+
     def _images_to_final_pdf(self, image_list, output_path):
         """이미지 목록을 최종 PDF로 저장"""
         if not image_list:
@@ -240,9 +259,18 @@ class ExcelExporter:
     def _delete_empty_rows(self, ws, data_end_row):
         """불필요한 빈 행 삭제"""
         try:
+            # 연속된 빈 행은 한 번의 delete_rows로 삭제 (행마다 아래 셀 전체를 당기지 않도록)
+            run_end = None
             for row_num in range(ws.max_row, data_end_row, -1):
                 if all(ws.cell(row=row_num, column=col).value is None for col in range(1, 8)):
-                    ws.delete_rows(row_num, 1)
+                    if run_end is None:
+                        run_end = row_num
+                    continue
+                if run_end is not None:
+                    ws.delete_rows(row_num + 1, run_end - row_num)
+                    run_end = None
+            if run_end is not None:
+                ws.delete_rows(data_end_row + 1, run_end - data_end_row)
         except Exception as e:
             logger.warning(f"행 삭제 중 오류: {e}")
 
@@ -251,18 +279,17 @@ class ExcelExporter:
         try:
             ws.merge_cells(f'A6:A{data_end_row}')
             ws.merge_cells(f'B6:B{data_end_row}')
-            ws['A6'].alignment = Alignment(horizontal='center', vertical='center')
-            ws['B6'].alignment = Alignment(horizontal='center', vertical='center')
+            ws['A6'].alignment = _CENTER_ALIGNMENT
+            ws['B6'].alignment = _CENTER_ALIGNMENT
         except Exception as e:
             logger.warning(f"셀 병합 중 오류: {e}")
 
     def _apply_borders(self, ws, data_end_row):
         """테이블 경계선 적용"""
         try:
-            thin_border = Border(left=Side(style='thin'), right=Side(style='thin'), top=Side(style='thin'), bottom=Side(style='thin'))
-            for row in range(5, data_end_row + 1):
-                for col in range(1, 8):
-                    ws.cell(row=row, column=col).border = thin_border
-                    ws.cell(row=row, column=col).alignment = Alignment(horizontal='center', vertical='center')
+            for row in ws.iter_rows(min_row=5, max_row=data_end_row, min_col=1, max_col=7):
+                for cell in row:
+                    cell.border = _THIN_BORDER
+                    cell.alignment = _CENTER_ALIGNMENT
         except Exception as e:
             logger.warning(f"경계선 적용 중 오류: {e}")
@@ -6,6 +6,20 @@ import glob
 from typing import Optional, Tuple
 from utils.logger import logger
 
+# Gamma lookup tables (one value per 8-bit level), built once instead of per point() call
+_SRGB_TO_LINEAR_LUT = [((p / 255.0) ** 2.2) * 255.0 for p in range(256)]
+_LINEAR_TO_SRGB_LUT = [((p / 255.0) ** (1.0 / 2.2)) * 255.0 for p in range(256)]
+
+# Minimum alpha for visible ink pixels (prevents excessive transparency)
+_MIN_ALPHA = int(255 * 0.35)
+_ALPHA_CLAMP_LUT = [max(p, _MIN_ALPHA) if p > 0 else 0 for p in range(256)]
+
+
+def _apply_lut(image, lut):
+    """Applies a single-band lookup table to every band of the image."""
+    return image.point(lut * len(image.getbands()))
+
+
 class ImageProcessor:
     def __init__(self, resources_path=".", config=None):
         self.resources_path = resources_path
@@ -62,22 +76,22 @@ class ImageProcessor:
     def _to_linear(self, image):
         """Converts an sRGB image to linear color space, preserving the alpha channel."""
         if image.mode != 'RGBA':
-            return image.point(lambda p: ((p / 255.0) ** 2.2) * 255.0)
+            return _apply_lut(image, _SRGB_TO_LINEAR_LUT)
         
         r, g, b, a = image.split()
         rgb = Image.merge('RGB', (r, g, b))
-        linear_rgb = rgb.point(lambda p: ((p / 255.0) ** 2.2) * 255.0)
+        linear_rgb = _apply_lut(rgb, _SRGB_TO_LINEAR_LUT)
         r, g, b = linear_rgb.split()
         return Image.merge('RGBA', (r, g, b, a))
 
     def _to_srgb(self, image):
         """Converts a linear image back to sRGB color space, preserving the alpha channel."""
         if image.mode != 'RGBA':
-            return image.point(lambda p: ((p / 255.0) ** (1.0 / 2.2)) * 255.0)
+            return _apply_lut(image, _LINEAR_TO_SRGB_LUT)
             
         r, g, b, a = image.split()
         rgb = Image.merge('RGB', (r, g, b))
-        srgb_rgb = rgb.point(lambda p: ((p / 255.0) ** (1.0 / 2.2)) * 255.0)
+        srgb_rgb = _apply_lut(rgb, _LINEAR_TO_SRGB_LUT)
         r, g, b = srgb_rgb.split()
         return Image.merge('RGBA', (r, g, b, a))
 
@@ -96,16 +110,17 @@ class ImageProcessor:
         # Soften the noise
         noise_img = Image.fromarray((noise01 * 255).astype(np.uint8), 'L')
         noise_img = noise_img.filter(ImageFilter.GaussianBlur(radius=1.5))
-        soft_noise = np.array(noise_img) / 255.0
+        # 8-bit channels only need float32 precision (half the memory of the float64 default)
+        soft_noise = np.asarray(noise_img, dtype=np.float32) / np.float32(255.0)
         
-        alpha_np = np.array(alpha_channel) / 255.0
+        alpha_np = np.asarray(alpha_channel, dtype=np.float32) / np.float32(255.0)
         
         # Create a mask to protect thin strokes
         ink_mask = (alpha_np > 0.2).astype(np.float32)
         
         # Apply centered noise multiplicatively, using the mask
-        centered_noise = soft_noise - 0.5
-        noisy_alpha = alpha_np * (1.0 + (centered_noise * strength * ink_mask))
+        centered_noise = soft_noise - np.float32(0.5)
+        noisy_alpha = alpha_np * (np.float32(1.0) + (centered_noise * np.float32(strength) * ink_mask))
         noisy_alpha = np.clip(noisy_alpha, 0, 1)
         
         return Image.fromarray((noisy_alpha * 255).astype(np.uint8), 'L')
@@ -175,8 +190,7 @@ class ImageProcessor:
             alpha.save(os.path.join(debug_path, f"{base_name}_alpha_2_closing.png"))
 
         # Set a minimum alpha value to prevent excessive transparency
-        min_alpha = int(255 * 0.35)
-        alpha = alpha.point(lambda p: max(p, min_alpha) if p > 0 else 0)
+        alpha = alpha.point(_ALPHA_CLAMP_LUT)
         if debug_path:
             alpha.save(os.path.join(debug_path, f"{base_name}_alpha_3_clamping.png"))
 
@@ -184,7 +198,8 @@ class ImageProcessor:
         alpha = self._pressure_noise(alpha, self.config.get('pressure_noise_strength', 0.0))
         if debug_path:
             alpha.save(os.path.join(debug_path, f"{base_name}_alpha_4_pressure_noise.png"))
-        alpha = alpha.point(lambda p: min(255, int(p * self.config.get('ink_alpha_factor', 1.5))))
+        ink_alpha_factor = self.config.get('ink_alpha_factor', 1.5)
+        alpha = alpha.point([min(255, int(p * ink_alpha_factor)) for p in range(256)])
         if debug_path:
             alpha.save(os.path.join(debug_path, f"{base_name}_alpha_5_ink_alpha_factor.png"))
 
@@ -1,12 +1,27 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import List, Tuple
 
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
 from utils.logger import logger
 
+try:
+    import pyarrow  # noqa: F401  (optional, requirements.txt only)
+    # Arrow-backed strings keep LOT/item-code columns compact and compare without Python objects
+    _TEXT_DTYPE = "string[pyarrow]"
+except ImportError:
+    _TEXT_DTYPE = str
+
+
+@lru_cache(maxsize=256)
+def _parse_work_date(work_date: str) -> np.datetime64:
+    """Parses a 'YYYY-MM-DD' work date once; bulk runs look up every material for the same few dates."""
+    return np.datetime64(datetime.strptime(work_date, "%Y-%m-%d"))
+
 
 class LotManager:
     def __init__(self, excel_path):
@@ -15,6 +30,7 @@ class LotManager:
         """
         self.excel_path = excel_path
         self.df = None
+        self._item_groups = {}
         self.load_data()
 
     def load_data(self):
@@ -26,20 +42,47 @@ class LotManager:
             # Specify dtype to ensure LOT numbers and item codes are treated as strings
             self.df = pd.read_excel(
                 self.excel_path,
-                dtype={'Lot.No': str, '품목코드': str}
+                dtype={'Lot.No': _TEXT_DTYPE, '품목코드': _TEXT_DTYPE}
             )
             # Convert date column to datetime objects for comparison
             # Assuming the first column is the date column.
             date_column_name = self.df.columns[0]
-            self.df[date_column_name] = pd.to_datetime(self.df[date_column_name])
+            # Excel date cells already arrive as datetime64; only text dates need parsing,
+            # and those are parsed with a single fixed format instead of per-value inference.
+            if not pd.api.types.is_datetime64_any_dtype(self.df[date_column_name]):
+                self.df[date_column_name] = pd.to_datetime(
+                    self.df[date_column_name], format="ISO8601", errors="coerce"
+                )
+            # Group rows by item code once so each lookup is a dict hit instead of a full-column scan
+            self._item_groups = self._group_by_item(self.df)
         except FileNotFoundError:
             # Handle case where the Excel file doesn't exist
             logger.warning(f"LOT 데이터 파일을 찾을 수 없습니다: {self.excel_path}")
             self.df = pd.DataFrame()
+            self._item_groups = {}
         except Exception as e:
             # Handle other potential errors during file loading
             logger.error(f"LOT 데이터 로드 중 오류 발생 ({self.excel_path}): {e}", exc_info=True)
             self.df = pd.DataFrame()
+            self._item_groups = {}
+
+    @staticmethod
+    def _group_by_item(df: pd.DataFrame) -> dict:
+        """Splits the shipment table into per-item-code frames ordered by shipment date.
+
+        The stable sort keeps the file order among rows of the same date, and NaT dates go last,
+        so get_lot can binary-search each frame instead of masking it.
+        """
+        if df.empty or '품목코드' not in df.columns:
+            return {}
+        date_column_name = df.columns[0]
+        ordered = df.sort_values(date_column_name, kind="stable", na_position="last")
+        # Item codes repeat across many shipments: group on categorical codes instead of hashing strings
+        item_codes = ordered['품목코드'].astype('category')
+        return {
+            code: group
+            for code, group in ordered.groupby(item_codes, sort=False, observed=True)
+        }
 
     def get_lot(self, item_code: str, work_date: str) -> List[Tuple[str, str]]:
         """
@@ -60,39 +103,36 @@ class LotManager:
             return []
 
         try:
-            work_datetime = datetime.strptime(work_date, "%Y-%m-%d")
+            work_datetime = _parse_work_date(work_date)
             date_column_name = self.df.columns[0]
 
-            # 1. 품목코드로 필터링
-            item_df = self.df[self.df['품목코드'] == item_code].copy()
-            logger.debug(f"1. 품목코드 '{item_code}' 필터링 결과: {len(item_df)}건")
-            if item_df.empty:
+            # 1. 품목코드로 필터링 (로드 시 미리 나눈 그룹 조회, 읽기 전용이므로 복사하지 않음)
+            item_df = self._item_groups.get(item_code)
+            logger.debug(f"1. 품목코드 '{item_code}' 필터링 결과: {0 if item_df is None else len(item_df)}건")
+            if item_df is None:
                 logger.warning(f"'{item_code}'에 해당하는 품목이 OUT.xlsx에 없습니다.")
                 return []
 
-            # 상세 로깅
-            logger.debug(f"  - 비교 기준 작업일자 (datetime): {work_datetime}")
-            if not item_df.empty:
-                log_df = item_df[[date_column_name, 'Lot.No']].dropna(subset=['Lot.No'])
-                logger.debug(f"  - '{item_code}'에 대한 전체 출고 데이터:\n{log_df.to_string()}")
-
-            # 2. 작업일자 이후 출고건으로 필터링
-            relevant_dates_df = item_df[item_df[date_column_name] >= work_datetime]
-            logger.debug(f"2. 작업일자 '{work_date}' 이후 출고 건 필터링 결과: {len(relevant_dates_df)}건")
-            if relevant_dates_df.empty:
+            # 2~4. 날짜순으로 정렬된 그룹에서 작업일자 이후 가장 가까운 출고일자 구간을 이진 탐색
+            #      (>= 마스크, min, == 마스크 세 번의 전체 스캔 대신 한 번의 탐색)
+            dates = item_df[date_column_name].to_numpy()
+            start = int(np.searchsorted(dates, work_datetime, side='left'))
+            if start == len(dates) or pd.isna(dates[start]):
                 logger.warning(f"'{item_code}'의 작업일자 이후 출고 기록이 없습니다.")
+                # 전체 출고 데이터 덤프는 추적 실패 시에만 남김
+                log_df = item_df[[date_column_name, 'Lot.No']].dropna(subset=['Lot.No'])
+                logger.debug(f"  - 비교 기준 작업일자: {work_datetime}, '{item_code}' 전체 출고 데이터:\n{log_df.to_string()}")
                 return []
 
-            # 3. 가장 가까운 미래 출고일자 찾기
-            closest_future_date = relevant_dates_df[date_column_name].min()
+            closest_future_date = pd.Timestamp(dates[start])
             closest_future_date_str = closest_future_date.strftime('%Y-%m-%d')
-            logger.debug(f"3. 가장 가까운 출고일자: {closest_future_date_str}")
+            end = int(np.searchsorted(dates, dates[start], side='right'))
+            logger.debug(f"3. 가장 가까운 출고일자: {closest_future_date_str} ({end - start}건)")
 
-            # 4. 해당 날짜의 모든 기록 가져오기
-            final_lots_df = relevant_dates_df[relevant_dates_df[date_column_name] == closest_future_date]
+            final_lots_df = item_df.iloc[start:end]
 
             # 5. 고유 로트번호 목록 생성
-            lots = final_lots_df['Lot.No'].unique().tolist()
+            lots = final_lots_df['Lot.No'].dropna().unique().tolist()
             logger.debug(f"4. 최종 후보 로트: {lots}")
 
             # 6. (로트, 날짜) 튜플 목록 생성 및 반환
@@ -68,7 +68,7 @@ class PdfConverter(QObject):
                     img, blur_radius, noise_range, contrast_factor, brightness_factor
                 )
                 processed_images.append(processed_img)
-                progress = 50 + int((i + 1) / len(page_images) * 30)
+                progress = 50 + (i + 1) * 30 // len(page_images)
                 self.progress_updated.emit(progress, f"스캔 효과 적용 중... ({i+1}/{len(page_images)}페이지)")
 
             # 4단계: 이미지 → 최종 PDF
@@ -34,7 +34,7 @@ class GenerationWorker(QThread):
         for i in range(self.num_variations):
             image = self.generator.generate_composite_image(self.worker_name, self.params)
             images.append(image)
-            self.progress.emit(int((i + 1) / self.num_variations * 100))
+            self.progress.emit((i + 1) * 100 // self.num_variations)
 
         self.finished.emit(images)
 
@@ -62,6 +62,7 @@ def main():
             export=False
         )
 
+        db.close()
         print(f"SELFTEST OK: {count} records")
 
 
@@ -50,6 +50,7 @@ class TestDataIntegration(unittest.TestCase):
     def tearDown(self):
         # Restore original init
         DataManager.__init__ = self._original_init
+        self.dm.db_manager.close()
         
         # Cleanup temp dir
         shutil.rmtree(self.test_dir)
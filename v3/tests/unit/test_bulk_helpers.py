@@ -69,6 +69,7 @@ class TestDhrDatabaseMessages(unittest.TestCase):
             manager = DhrDatabaseManager(db_path=os.path.join(tmp, "dhr.db"))
 
             lot = manager.generate_product_lot("TEST", "2026-03-31")
+            manager.close()
 
             self.assertEqual(lot, "TEST26033101")
             mock_logger.error.assert_called_once_with(
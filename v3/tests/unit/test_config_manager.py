@@ -106,6 +106,80 @@ class TestConfig(unittest.TestCase):
         self.assertEqual(len(workers), 2)
         self.assertIn("Worker1", workers)
 
+    @patch('os.path.exists')
+    @patch('builtins.open', new_callable=mock_open)
+    @patch('os.makedirs')
+    def test_save_skips_unchanged_values(self, mock_makedirs, mock_file, mock_exists):
+        """값이 바뀌지 않은 설정 저장은 파일을 다시 쓰지 않음"""
+        mock_exists.return_value = False
+
+        from config.config_manager import Config
+        cfg = Config()
+        cfg._data = self.mock_config_data
+
+        with patch.object(cfg, '_save_config', return_value=True) as mock_save:
+            workers = ["Worker1", "Worker2"]
+            self.assertTrue(cfg.save_workers(workers))
+            self.assertTrue(cfg.save_scan_effects({"blur_radius": 0.5}))
+            mock_save.assert_not_called()
+
+            workers.append("Worker3")
+            self.assertTrue(cfg.save_workers(workers))
+            self.assertTrue(cfg.save_last_worker("Worker3"))
+            self.assertTrue(cfg.save_scan_effects({"blur_radius": 0.7}))
+            self.assertEqual(mock_save.call_count, 3)
+
+            # 저장한 목록을 호출자가 제자리에서 바꿔도 설정값은 따라 바뀌지 않아 다음 저장이 누락되지 않음
+            workers.append("Worker4")
+            self.assertEqual(cfg.workers, ["Worker1", "Worker2", "Worker3"])
+            self.assertTrue(cfg.save_workers(workers))
+            self.assertEqual(mock_save.call_count, 4)
+
+    @patch('os.path.exists')
+    @patch('builtins.open', new_callable=mock_open)
+    @patch('os.makedirs')
+    def test_failed_save_is_retried(self, mock_makedirs, mock_file, mock_exists):
+        """파일 쓰기에 실패한 값은 메모리에도 남지 않아 같은 값으로 다시 저장하면 실제로 기록"""
+        mock_exists.return_value = False
+
+        from config.config_manager import Config
+        cfg = Config()
+        cfg._data = self.mock_config_data
+
+        with patch.object(cfg, '_save_config', return_value=False) as mock_save:
+            self.assertFalse(cfg.save_workers(["Worker3"]))
+            self.assertFalse(cfg.save_last_worker("Worker3"))
+            self.assertFalse(cfg.save_scan_effects({"blur_radius": 0.7, "dpi": 200}))
+        self.assertEqual(mock_save.call_count, 3)
+        self.assertEqual(cfg.workers, ["Worker1", "Worker2"])
+        self.assertEqual(cfg.last_worker, "")
+        self.assertEqual(cfg.get("scan_effects"), {"dpi": 300, "blur_radius": 0.5})
+
+        with patch.object(cfg, '_save_config', return_value=True) as mock_save:
+            self.assertTrue(cfg.save_workers(["Worker3"]))
+            self.assertTrue(cfg.save_last_worker("Worker3"))
+            self.assertTrue(cfg.save_scan_effects({"blur_radius": 0.7, "dpi": 200}))
+            self.assertEqual(mock_save.call_count, 3)
+
+    @patch('os.path.exists')
+    @patch('builtins.open', new_callable=mock_open)
+    @patch('os.makedirs')
+    def test_get_view_is_read_only(self, mock_makedirs, mock_file, mock_exists):
+        """읽기 전용 조회는 복사 없이 변경 불가능한 뷰를 반환"""
+        mock_exists.return_value = False
+
+        from config.config_manager import Config
+        cfg = Config()
+        cfg._data = self.mock_config_data
+
+        view = cfg.get_view("scan_effects")
+        self.assertEqual(view["blur_radius"], 0.5)
+        with self.assertRaises(TypeError):
+            view["blur_radius"] = 1.0
+        self.assertEqual(cfg.get_view("mixing.workers"), ("Worker1", "Worker2"))
+        self.assertEqual(cfg.get_view("nested.level1.level2"), "deep_value")
+        self.assertEqual(cfg.get_view("nonexistent.key", {}), {})
+
 
 if __name__ == '__main__':
     unittest.main()
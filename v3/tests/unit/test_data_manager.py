@@ -1,9 +1,11 @@
 
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 import os
 import sys
 
+import pandas as pd
+
 # Ensure project root is in path
 current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(current_dir))
@@ -42,13 +44,11 @@ class TestDataManager(unittest.TestCase):
     def test_load_recipes_success(self):
         """Test successful loading of recipes from Excel"""
         # Setup mock dataframe
-        mock_df = MagicMock()
-        mock_df.iterrows.return_value = [
-            (0, {'레시피': 'RecipeA', '품목코드': 'M001', '품목명': 'Material1', '배합비율': 50.0}),
-            (1, {'레시피': 'RecipeA', '품목코드': 'M002', '품목명': 'Material2', '배합비율': 50.0}),
-            (2, {'레시피': 'RecipeB', '품목코드': 'M003', '품목명': 'Material3', '배합비율': 100.0}),
-        ]
-        self.mock_read_excel.return_value = mock_df
+        self.mock_read_excel.return_value = pd.DataFrame([
+            {'레시피': 'RecipeA', '품목코드': 'M001', '품목명': 'Material1', '배합비율': 50.0},
+            {'레시피': 'RecipeA', '품목코드': 'M002', '품목명': 'Material2', '배합비율': 50.0},
+            {'레시피': 'RecipeB', '품목코드': 'M003', '품목명': 'Material3', '배합비율': 100.0},
+        ])
 
         # Initialize DataManager (calls _load_recipes_from_excel internally)
         dm = DataManager()
@@ -64,8 +64,8 @@ class TestDataManager(unittest.TestCase):
         """Test LOT generation for the first record of the day"""
         dm = DataManager()
         
-        # Mock DB returning no records for the day
-        self.db_manager_mock.get_mixing_records.return_value = []
+        # Mock DB returning no LOT sequence for the day
+        self.db_manager_mock.get_max_lot_sequence.return_value = 0
         
         recipe_name = "TestRecipe"
         work_date = "2023-10-27"
@@ -80,11 +80,8 @@ class TestDataManager(unittest.TestCase):
         """Test LOT generation increments correctly"""
         dm = DataManager()
         
-        # Mock DB returning existing records
-        self.db_manager_mock.get_mixing_records.return_value = [
-            {'product_lot': 'TestRecipe23102701'},
-            {'product_lot': 'TestRecipe23102702'},
-        ]
+        # Mock DB returning the highest existing sequence (TestRecipe23102702)
+        self.db_manager_mock.get_max_lot_sequence.return_value = 2
         
         recipe_name = "TestRecipe"
         work_date = "2023-10-27"
@@ -94,6 +91,7 @@ class TestDataManager(unittest.TestCase):
         
         lot = dm.generate_product_lot(recipe_name, work_date)
         self.assertEqual(lot, expected_lot)
+        self.db_manager_mock.get_max_lot_sequence.assert_called_with(recipe_name, work_date, "TestRecipe231027")
 
     def test_validate_record_inputs_success(self):
         """Test record input validation success"""
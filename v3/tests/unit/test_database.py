@@ -0,0 +1,249 @@
+"""
+DatabaseManager 단위 테스트
+"""
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+import threading
+
+# Ensure project root is in path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+sys.path.insert(0, project_root)
+
+from models.database import DatabaseManager
+
+
+def _record(product_lot, recipe_name="RecipeA", worker="홍길동", work_date="2025-01-10"):
+    return {
+        'product_lot': product_lot,
+        'recipe_name': recipe_name,
+        'worker': worker,
+        'work_date': work_date,
+        'work_time': "09:00:00",
+        'total_amount': 100.0,
+        'scale': "M-65",
+    }
+
+
+def _details():
+    return [
+        {'material_code': "M001", 'material_name': "Material A", 'material_lot': "L1",
+         'ratio': 60.0, 'theory_amount': 60.0, 'actual_amount': 60.0},
+        {'material_code': "M002", 'material_name': "Material B", 'material_lot': "L2",
+         'ratio': 40.0, 'theory_amount': 40.0, 'actual_amount': 40.0},
+    ]
+
+
+class TestDatabaseManager(unittest.TestCase):
+    """DatabaseManager 조회 테스트"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.db = DatabaseManager(os.path.join(self.test_dir, 'test_mixing.db'))
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.test_dir)
+
+    def test_records_newest_first(self):
+        """같은 시각에 저장된 기록도 저장 역순으로 조회"""
+        for lot in ("RA250110", "RA250110-2", "RA250110-3"):
+            self.db.save_mixing_record(_record(lot), _details())
+
+        lots = [r['product_lot'] for r in self.db.get_mixing_records()]
+        self.assertEqual(lots, ["RA250110-3", "RA250110-2", "RA250110"])
+
+    def test_records_paging(self):
+        """limit/offset 페이지 조회"""
+        for i in range(5):
+            self.db.save_mixing_record(_record(f"RA250110-{i}"), _details())
+
+        first = [r['product_lot'] for r in self.db.get_mixing_records(limit=2)]
+        second = [r['product_lot'] for r in self.db.get_mixing_records(limit=2, offset=2)]
+        last = [r['product_lot'] for r in self.db.get_mixing_records(limit=2, offset=4)]
+        self.assertEqual(first, ["RA250110-4", "RA250110-3"])
+        self.assertEqual(second, ["RA250110-2", "RA250110-1"])
+        self.assertEqual(last, ["RA250110-0"])
+
+    def test_records_with_details_table(self):
+        """JOIN 조회는 (컬럼명, 튜플 행)으로 반환하고 LOT 조건 시 해당 LOT 상세만 순서대로 반환"""
+        self.db.save_mixing_record(_record("RA250110"), _details())
+        self.db.save_mixing_record(_record("RB250110"), _details())
+
+        columns, rows = self.db.get_records_with_details_table(product_lot="RB250110")
+        lot_idx, code_idx = columns.index('product_lot'), columns.index('material_code')
+        self.assertEqual([r[lot_idx] for r in rows], ["RB250110", "RB250110"])
+        self.assertEqual([r[code_idx] for r in rows], ["M001", "M002"])
+        self.assertEqual(self.db.get_records_with_details_table(product_lot="NONE")[1], [])
+
+        columns, rows = self.db.get_records_with_details_table()
+        self.assertEqual([r[lot_idx] for r in rows], ["RB250110", "RB250110", "RA250110", "RA250110"])
+
+        # limit은 기록 단위: 최근 기록 1건의 상세 2행을 모두 반환
+        columns, rows = self.db.get_records_with_details_table(limit=1)
+        self.assertEqual([(r[lot_idx], r[code_idx]) for r in rows], [("RB250110", "M001"), ("RB250110", "M002")])
+
+    def test_update_mixing_details(self):
+        """상세 정보 일괄 수정"""
+        record_id = self.db.save_mixing_record(_record("RA250110"), _details())
+        self.assertTrue(self.db.update_mixing_details(record_id, [
+            {'material_code': "M001", 'material_lot': "L1-NEW", 'ratio': 55.0,
+             'theory_amount': 55.0, 'actual_amount': 55.5},
+            {'material_code': "M002", 'material_lot': "L2-NEW", 'ratio': 45.0,
+             'theory_amount': 45.0, 'actual_amount': 44.5},
+        ]))
+
+        details = self.db.get_mixing_details(record_id)
+        self.assertEqual([d['material_lot'] for d in details], ["L1-NEW", "L2-NEW"])
+        self.assertEqual([d['actual_amount'] for d in details], [55.5, 44.5])
+        self.assertEqual([d['sequence_order'] for d in details], [1, 2])
+
+    def test_connection_reused_without_leaking_uncommitted(self):
+        """연결은 재사용하되 커밋하지 않은 변경은 다음 호출에 남지 않음"""
+        with self.db.get_connection() as conn:
+            conn.execute("INSERT INTO recipes (recipe_name, material_code, material_name, ratio, sequence_order) VALUES ('R', 'M', 'N', 1, 1)")
+            first = conn
+        with self.db.get_connection() as conn:
+            self.assertIs(conn, first)
+            self.assertFalse(conn.in_transaction)
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM recipes").fetchone()[0], 0)
+
+    def test_worker_thread_connection_closed(self):
+        """작업 스레드의 연결은 사용 후 닫히고 메인 스레드 연결만 유지"""
+        self.db.get_mixing_records()
+        worker = threading.Thread(target=self.db.save_mixing_record, args=(_record("RA250110"), _details()))
+        worker.start()
+        worker.join()
+
+        self.assertEqual(len(self.db._connections._connections), 1)
+        self.assertEqual([r['product_lot'] for r in self.db.get_mixing_records()], ["RA250110"])
+
+    def test_backup_includes_recent_changes(self):
+        """WAL 모드에서도 백업 파일에 최근 저장분이 포함됨"""
+        self.db.save_mixing_record(_record("RA250110"), _details())
+        backup_path = self.db.backup_database(os.path.join(self.test_dir, 'backup.db'))
+
+        backup = DatabaseManager(backup_path)
+        self.assertEqual([r['product_lot'] for r in backup.get_mixing_records()], ["RA250110"])
+        backup.close()
+
+    def test_detail_lookup_uses_index(self):
+        """상세 조회는 기록 ID 복합 인덱스를 사용 (전체 스캔/정렬 없음)"""
+        with self.db.get_connection() as conn:
+            plan = " ".join(row[3] for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM mixing_details WHERE mixing_record_id = ? ORDER BY sequence_order",
+                (1,)
+            ))
+        self.assertIn("idx_mixing_details_record", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+    def test_max_lot_sequence(self):
+        """같은 날짜/레시피의 숫자 시퀀스만 최댓값으로 집계"""
+        self.assertEqual(self.db.get_max_lot_sequence("RA", "2025-01-10", "RA250110"), 0)
+        for lot in ("RA25011001", "RA25011009", "RA250110-X"):
+            self.db.save_mixing_record(_record(lot, recipe_name="RA"), _details())
+        self.db.save_mixing_record(_record("RA25011012", recipe_name="RA", work_date="2025-01-11"), _details())
+        self.db.save_mixing_record(_record("RA25011015", recipe_name="RB"), _details())
+        self.assertEqual(self.db.get_max_lot_sequence("RA", "2025-01-10", "RA250110"), 9)
+
+    def test_statistics(self):
+        """통계는 한 번의 조회로 세 집계를 반환"""
+        self.db.save_mixing_record(_record("RA250110", work_date="2000-01-01"), _details())
+        self.db.save_mixing_record(_record("RA250111", work_date="2999-01-01"), _details())
+        self.assertEqual(self.db.get_statistics(),
+                         {'total_records': 2, 'recent_records': 1, 'recipe_count': 0})
+
+    def _scan_total(self, start_date, end_date, material_name):
+        """집계 테이블 없이 상세 테이블을 직접 합산한 기대값"""
+        with self.db.get_connection() as conn:
+            row = conn.execute("""
+                SELECT COALESCE(SUM(d.actual_amount), 0.0) AS total
+                FROM mixing_details d JOIN mixing_records r ON d.mixing_record_id = r.id
+                WHERE r.work_date BETWEEN ? AND ? AND d.material_name = ?
+            """, (start_date, end_date, material_name)).fetchone()
+            return row['total']
+
+    def test_material_totals_follow_changes(self):
+        """품목 일자 집계 테이블이 저장/수정/삭제를 따라감"""
+        first = self.db.save_mixing_record(_record("RA250110", work_date="2025-01-10"), _details())
+        second = self.db.save_mixing_record(_record("RA250111", work_date="2025-01-11"), _details())
+        self.assertAlmostEqual(self.db.sum_item_amount_by_date_range("2025-01-01", "2025-01-31", "Material A"), 120.0)
+
+        self.db.update_mixing_details(first, [
+            {'material_code': "M001", 'material_lot': "L1", 'ratio': 60.0,
+             'theory_amount': 60.0, 'actual_amount': 61.5},
+        ])
+        with self.db.get_connection() as conn:
+            conn.execute("UPDATE mixing_records SET work_date = '2025-02-01' WHERE id = ?", (second,))
+            conn.commit()
+
+        for start, end in (("2025-01-01", "2025-01-31"), ("2025-02-01", "2025-02-28"), ("2025-01-10", "2025-01-10")):
+            for name in ("Material A", "Material B"):
+                self.assertAlmostEqual(self.db.sum_item_amount_by_date_range(start, end, name),
+                                       self._scan_total(start, end, name))
+
+        self.assertEqual(self.db.get_all_material_names(), ["Material A", "Material B"])
+
+        self.db.delete_mixing_record(first)
+        self.db.delete_mixing_record(second)
+        self.assertEqual(self.db.get_all_material_names(), [])
+        self.assertEqual(self.db.sum_item_amount_by_date_range("2025-01-01", "2025-12-31", "Material A"), 0.0)
+        with self.db.get_connection() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM mixing_material_daily_totals").fetchone()[0], 0)
+
+    def test_aggregates_cached_until_data_changes(self):
+        """집계 결과는 DB가 바뀌기 전까지 재사용하고 다른 연결의 변경도 반영"""
+        self.db.save_mixing_record(_record("RA250110"), _details())
+        self.assertAlmostEqual(self.db.sum_item_amount_by_date_range("2025-01-01", "2025-01-31", "Material A"), 60.0)
+        self.assertEqual(len(self.db._aggregate_cache), 1)
+        self.db.get_all_material_names().append("임의 항목")
+        self.assertEqual(self.db.get_all_material_names(), ["Material A", "Material B"])
+        self.assertEqual(len(self.db._aggregate_cache), 2)
+
+        self.db.save_mixing_record(_record("RA250111"), _details())
+        self.assertAlmostEqual(self.db.sum_item_amount_by_date_range("2025-01-01", "2025-01-31", "Material A"), 120.0)
+
+        other = DatabaseManager(self.db.db_path)
+        other.save_mixing_record(_record("RA250112"), [_details()[0]])
+        other.close()
+        self.assertAlmostEqual(self.db.sum_item_amount_by_date_range("2025-01-01", "2025-01-31", "Material A"), 180.0)
+
+    def test_material_totals_backfill(self):
+        """집계 테이블이 없던 DB는 열 때 기존 기록으로 채움"""
+        self.db.save_mixing_record(_record("RA250110"), _details())
+        with self.db.get_connection() as conn:
+            conn.execute("DROP TABLE mixing_material_daily_totals")
+            conn.commit()
+
+        reopened = DatabaseManager(self.db.db_path)
+        self.assertAlmostEqual(reopened.sum_item_amount_by_date_range("2025-01-10", "2025-01-10", "Material B"), 40.0)
+        reopened.close()
+
+    def test_keyword_search(self):
+        """키워드 검색 (FTS 인덱스 / 짧은 검색어 LIKE 대체)"""
+        self.db.save_mixing_record(_record("RA250110", recipe_name="RecipeA", worker="홍길동"), _details())
+        self.db.save_mixing_record(_record("RB250110", recipe_name="RecipeB", worker="김철수"), _details())
+
+        lots = [r['product_lot'] for r in self.db.get_mixing_records(keyword="recipeb")]
+        self.assertEqual(lots, ["RB250110"])
+
+        lots = [r['product_lot'] for r in self.db.get_mixing_records(keyword="김철")]
+        self.assertEqual(lots, ["RB250110"])
+
+        lots = [r['product_lot'] for r in self.db.get_mixing_records(keyword="250110")]
+        self.assertEqual(sorted(lots), ["RA250110", "RB250110"])
+
+        self.assertEqual(self.db.get_mixing_records(keyword="100%"), [])
+
+    def test_keyword_search_follows_delete(self):
+        """삭제된 기록은 검색 인덱스에서도 제외"""
+        record_id = self.db.save_mixing_record(_record("RA250110"), _details())
+        self.assertTrue(self.db.delete_mixing_record(record_id))
+        self.assertEqual(self.db.get_mixing_records(keyword="RA2501"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""
+DhrDatabaseManager 단위 테스트
+"""
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+
+# Ensure project root is in path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+sys.path.insert(0, project_root)
+
+from models.dhr_database import DhrDatabaseManager
+
+
+def _record(product_lot, product_name="제품A", work_date="2025-01-10", work_time="09:00"):
+    return {
+        'product_lot': product_lot,
+        'product_name': product_name,
+        'worker': "홍길동",
+        'work_date': work_date,
+        'work_time': work_time,
+        'total_amount': 100.0,
+        'scale': "M-65",
+    }
+
+
+def _details():
+    return [
+        {'material_code': "M001", 'material_name': "Material A", 'material_lot': "L1",
+         'ratio': 60.0, 'theory_amount': 60.0, 'actual_amount': 60.0},
+        {'material_code': "M002", 'material_name': "Material B", 'material_lot': "L2",
+         'ratio': 40.0, 'theory_amount': 40.0, 'actual_amount': 40.0},
+    ]
+
+
+class TestDhrDatabaseManager(unittest.TestCase):
+    """DhrDatabaseManager 테스트"""
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.db = DhrDatabaseManager(os.path.join(self.test_dir, 'test_dhr.db'))
+
+    def tearDown(self):
+        self.db.close()
+        shutil.rmtree(self.test_dir)
+
+    def test_all_categories_grouped_by_type(self):
+        """분류 항목 전체를 타입별 정렬 목록으로 한 번에 조회"""
+        for category_type, value in (("company", "B사"), ("company", "A사"), ("drug", "약품1"), ("company", "A사")):
+            self.db.add_category(category_type, value)
+        categories = self.db.get_all_categories()
+        self.assertEqual(categories, {"company": ["A사", "B사"], "drug": ["약품1"]})
+        self.assertEqual(categories["company"], self.db.get_categories("company"))
+
+    def test_generate_product_lot_sequence(self):
+        """같은 날짜/제품의 최대 시퀀스 다음 번호로 LOT 생성"""
+        self.assertEqual(self.db.generate_product_lot("제품A", "2025-01-10"), "제품A25011001")
+
+        self.db.save_dhr_record(_record("제품A25011001"), _details())
+        self.db.save_dhr_record(_record("제품A25011009"), _details())
+        # 숫자가 아닌 접미사와 다른 날짜 기록은 무시
+        self.db.save_dhr_record(_record("제품A250110-X"), _details())
+        self.db.save_dhr_record(_record("제품A25011199", work_date="2025-01-11"), _details())
+
+        self.assertEqual(self.db.generate_product_lot("제품A", "2025-01-10"), "제품A25011010")
+        self.assertEqual(self.db.generate_product_lot("제품B", "2025-01-10"), "제품B25011001")
+
+    def test_latest_work_time(self):
+        """날짜/제품별 가장 늦은 작업시간 (시간 형식이 아닌 값 제외)"""
+        self.assertIsNone(self.db.get_latest_work_time("제품A", "2025-01-10"))
+
+        self.db.save_dhr_record(_record("제품A25011001", work_time="09:40:00"), _details())
+        self.db.save_dhr_record(_record("제품A25011002", work_time="13:05:30"), _details())
+        self.db.save_dhr_record(_record("제품A25011003", work_time="오후 3시"), _details())
+        self.db.save_dhr_record(_record("제품A25011004", work_time=""), _details())
+        self.db.save_dhr_record(_record("제품B25011001", product_name="제품B", work_time="18:00:00"), _details())
+
+        self.assertEqual(self.db.get_latest_work_time("제품A", "2025-01-10"), "13:05:30")
+        self.assertIsNone(self.db.get_latest_work_time("제품A", "2025-01-11"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+GoogleSheetsBackup 단위 테스트 (gspread는 가짜 모듈로 대체)
+"""
+import unittest
+from unittest.mock import MagicMock, patch
+import os
+import sys
+import types
+
+# Ensure project root is in path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+sys.path.insert(0, project_root)
+
+from models.backup.google_sheets_backup import GoogleSheetsBackup
+
+SPREADSHEET_URL = "https://docs.google.com/spreadsheets/d/test"
+
+
+def _fake_gspread():
+    """backup_records가 참조하는 예외 타입만 가진 gspread 대역"""
+    exceptions = types.SimpleNamespace(
+        SpreadsheetNotFound=type("SpreadsheetNotFound", (Exception,), {}),
+        WorksheetNotFound=type("WorksheetNotFound", (Exception,), {}),
+        APIError=type("APIError", (Exception,), {}),
+    )
+    module = types.ModuleType("gspread")
+    module.exceptions = exceptions
+    return module
+
+
+class TestGoogleSheetsBackup(unittest.TestCase):
+    """GoogleSheetsBackup 백업 흐름 테스트"""
+
+    def setUp(self):
+        self.gspread = _fake_gspread()
+        self.patcher_gspread = patch.dict(sys.modules, {"gspread": self.gspread})
+        self.patcher_gspread.start()
+
+        self.config = MagicMock()
+        self.config.is_backup_enabled.return_value = True
+        self.config.has_valid_settings.return_value = True
+        self.config.get_spreadsheet_url.return_value = SPREADSHEET_URL
+
+        self.backup = GoogleSheetsBackup(self.config)
+        self.backup.gc = MagicMock()  # 인증 완료 상태
+        self.worksheet = self.backup.gc.open_by_url.return_value.worksheet.return_value
+        self.worksheet.row_values.return_value = ["제품LOT", "작업자"]
+
+        self.records = [{"제품LOT": "RA250110", "작업자": "홍길동"}]
+
+    def tearDown(self):
+        self.patcher_gspread.stop()
+
+    def test_backup_reuses_worksheet(self):
+        """연속 백업은 같은 워크시트 핸들을 재사용"""
+        for _ in range(2):
+            success, _ = self.backup.backup_records(self.records)
+            self.assertTrue(success)
+
+        self.backup.gc.open_by_url.assert_called_once_with(SPREADSHEET_URL)
+        self.assertEqual(self.worksheet.append_rows.call_count, 2)
+        self.worksheet.append_rows.assert_called_with([["RA250110", "홍길동"]])
+        self.assertEqual(self.config.increment_backup_success.call_count, 2)
+
+    def test_api_error_resets_worksheet(self):
+        """API 오류는 실패로 반환하고 다음 백업에서 스프레드시트를 다시 엶"""
+        self.worksheet.append_rows.side_effect = self.gspread.exceptions.APIError("quota")
+
+        success, message = self.backup.backup_records(self.records)
+        self.assertFalse(success)
+        self.assertIn("quota", message)
+        self.config.increment_backup_failure.assert_called_once()
+        self.assertIsNone(self.backup._worksheet)
+
+        self.worksheet.append_rows.side_effect = None
+        success, _ = self.backup.backup_records(self.records)
+        self.assertTrue(success)
+        self.assertEqual(self.backup.gc.open_by_url.call_count, 2)
+
+    def test_headers_read_once_until_reset(self):
+        """헤더 행은 첫 백업에서만 읽고 오류로 핸들을 버린 뒤에는 다시 읽음"""
+        self.backup.backup_records(self.records)
+        self.backup.backup_records(self.records)
+        self.worksheet.row_values.assert_called_once_with(1)
+
+        self.worksheet.append_rows.side_effect = self.gspread.exceptions.APIError("quota")
+        self.backup.backup_records(self.records)
+        self.worksheet.append_rows.side_effect = None
+        self.backup.backup_records(self.records)
+        self.assertEqual(self.worksheet.row_values.call_count, 2)
+
+    def test_verified_headers_initialised(self):
+        """생성 직후에도 헤더 확인 상태가 초기화되어 있음"""
+        self.assertIsNone(GoogleSheetsBackup(self.config)._verified_headers)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -54,6 +54,22 @@ class TestRecipePanel(unittest.TestCase):
         self.assertEqual(self.panel.recipe_combo.count(), 3)
         self.assertEqual(self.panel.recipe_combo.itemText(1), "Recipe A")
 
+    def test_highlight_follows_workflow(self):
+        """레시피 선택 -> 배합량 입력 순으로 하이라이트 이동, 같은 상태는 다시 적용하지 않음"""
+        self.panel.set_recipes(["Recipe A"])
+        self.assertIn("border", self.panel.recipe_combo.styleSheet())
+
+        self.panel.recipe_combo.setCurrentIndex(1)
+        self.assertEqual(self.panel.recipe_combo.styleSheet(), "")
+        self.assertIn("border", self.panel.amount_spin.styleSheet())
+
+        self.panel.amount_spin.setValue(10.0)
+        cleared = self.panel.amount_spin.styleSheet()
+        self.assertNotIn("border", cleared)
+        with patch.object(self.panel.amount_spin, "setStyleSheet") as set_style:
+            self.panel.amount_spin.setValue(20.0)
+        set_style.assert_not_called()
+
 class TestWorkInfoPanel(unittest.TestCase):
     def setUp(self):
         self.patcher_config = patch('ui.panels.work_info_panel.config')
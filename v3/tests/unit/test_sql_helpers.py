@@ -0,0 +1,43 @@
+"""
+sql_helpers 단위 테스트
+"""
+import unittest
+import os
+import sys
+
+# Ensure project root is in path
+current_dir = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(os.path.dirname(current_dir))
+sys.path.insert(0, project_root)
+
+from utils.sql_helpers import build_where_clause, escape_like
+
+
+class TestBuildWhereClause(unittest.TestCase):
+    """build_where_clause 테스트"""
+
+    def test_skips_empty_values(self):
+        where, params = build_where_clause([
+            ("work_date >= ?", "2025-01-01"),
+            ("work_date <= ?", None),
+            ("worker = ?", ""),
+        ])
+        self.assertEqual(where, "1=1 AND work_date >= ?")
+        self.assertEqual(params, ["2025-01-01"])
+
+    def test_tuple_value_binds_multiple_params(self):
+        where, params = build_where_clause([("(a LIKE ? OR b LIKE ?)", ("%x%", "%x%"))], base="is_active = 1")
+        self.assertEqual(where, "is_active = 1 AND (a LIKE ? OR b LIKE ?)")
+        self.assertEqual(params, ["%x%", "%x%"])
+
+
+class TestEscapeLike(unittest.TestCase):
+    """escape_like 테스트"""
+
+    def test_escapes_wildcards(self):
+        self.assertEqual(escape_like("10%_a"), "%10\\%\\_a%")
+        self.assertEqual(escape_like("a\\b"), "%a\\\\b%")
+
+
+if __name__ == '__main__':
+    unittest.main()
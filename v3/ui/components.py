@@ -2,6 +2,11 @@
 재사용 가능한 UI 컴포넌트들
 공통으로 사용되는 UI 요소들을 모듈화합니다.
 """
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Iterator
+
 from PySide6.QtWidgets import (
     QApplication, QComboBox, QDialog, QDoubleSpinBox, QGraphicsDropShadowEffect,
     QGroupBox, QHBoxLayout, QLabel, QLineEdit, QProgressBar, QPushButton,
@@ -15,6 +20,33 @@ from config.config_manager import config
 from utils.logger import logger
 from ui.styles import UIStyles, UITheme  # 테마/스타일 임포트
 
+# 입력 필드 검증 결과 스타일 (검증마다 포맷하지 않도록 미리 생성)
+_FIELD_ERROR_STYLE = f"""
+    QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {{
+        background-color: {UITheme.ERROR_BG};
+        border: 1px solid {UITheme.ERROR_COLOR};
+        border-radius: 6px;
+        padding: 8px 12px;
+        color: {UITheme.TEXT_PRIMARY};
+    }}
+"""
+_FIELD_NORMAL_STYLE = f"""
+    QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {{
+        background-color: {UITheme.FIELD_BG};
+        border: 1px solid {UITheme.BORDER_COLOR};
+        border-radius: 6px;
+        padding: 8px 12px;
+        color: {UITheme.TEXT_PRIMARY};
+    }}
+"""
+# 주요/성공 버튼 스타일 (텍스트 색상 보정 포함, 버튼마다 이어 붙여 두 번 적용하지 않도록 미리 생성)
+_PRIMARY_BUTTON_STYLE = UIStyles.get_primary_button_style() + f"QPushButton {{ color: {UITheme.TEXT_ON_ACCENT}; }}"
+# 버튼 종류별 스타일 (그 외 종류는 보조 버튼 스타일)
+_BUTTON_STYLES = {
+    "primary": _PRIMARY_BUTTON_STYLE,
+    "success": _PRIMARY_BUTTON_STYLE,
+    "danger": UIStyles.get_danger_button_style(),
+}
 
 
 def center_window(widget: QWidget):
@@ -25,6 +57,15 @@ def center_window(widget: QWidget):
     widget_geo.moveCenter(center_point)
     widget.move(widget_geo.topLeft())
 
+@contextmanager
+def suspend_updates(widget: QWidget) -> Iterator[QWidget]:
+    """여러 셀을 채우는 동안 다시 그리기를 멈추고, 끝나면 한 번에 갱신합니다."""
+    widget.setUpdatesEnabled(False)
+    try:
+        yield widget
+    finally:
+        widget.setUpdatesEnabled(True)
+
 def create_group_box(title: str, widget: QWidget) -> QGroupBox:
 
     """QGroupBox를 생성하고 위젯을 배치합니다. (DRY 헬퍼)
@@ -46,20 +87,8 @@ def create_group_box(title: str, widget: QWidget) -> QGroupBox:
 def StyledButton(text: str, button_type: str = "primary", parent=None) -> PushButton:
     """Fluent-style button factory with Premium Theme."""
     btn = PushButton(text, parent)
-    
-    if button_type in ["primary", "success"]:
-        btn.setStyleSheet(UIStyles.get_primary_button_style())
-        # 특정 버튼 텍스트 색상 보정
-        current_style = btn.styleSheet()
-        btn.setStyleSheet(current_style + f"QPushButton {{ color: {UITheme.TEXT_ON_ACCENT}; }}")
-        
-    elif button_type == "danger":
-        btn.setStyleSheet(UIStyles.get_danger_button_style())
-        
-    else:
-        # Default/Secondary/Info
-        btn.setStyleSheet(UIStyles.get_secondary_button_style())
-        
+    # Default/Secondary/Info는 보조 버튼 스타일
+    btn.setStyleSheet(_BUTTON_STYLES.get(button_type) or UIStyles.get_secondary_button_style())
     return btn
 
 
@@ -124,26 +153,7 @@ class LabeledField(QWidget):
     
     def highlight_error(self, error: bool = True):
         """오류 하이라이트"""
-        if error:
-            self.widget.setStyleSheet(f"""
-                QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {{
-                    background-color: {UITheme.ERROR_BG};
-                    border: 1px solid {UITheme.ERROR_COLOR};
-                    border-radius: 6px;
-                    padding: 8px 12px;
-                    color: {UITheme.TEXT_PRIMARY};
-                }}
-            """)
-        else:
-            self.widget.setStyleSheet(f"""
-                QLineEdit, QSpinBox, QDoubleSpinBox, QComboBox {{
-                    background-color: {UITheme.FIELD_BG};
-                    border: 1px solid {UITheme.BORDER_COLOR};
-                    border-radius: 6px;
-                    padding: 8px 12px;
-                    color: {UITheme.TEXT_PRIMARY};
-                }}
-            """)
+        self.widget.setStyleSheet(_FIELD_ERROR_STYLE if error else _FIELD_NORMAL_STYLE)
 
 
 class InfoCard(CardWidget):
@@ -237,17 +247,32 @@ class StatusBar(QStatusBar):
         self.time_label.setStyleSheet(f"color: {UITheme.TEXT_PRIMARY};")
         self.addPermanentWidget(self.time_label)
         
-        # 타이머 설정
+        # 타이머 설정 (마지막으로 표시한 초는 같은 초에 다시 포맷하지 않도록 기억)
+        self._shown_second = None
         self.timer = QTimer()
         self.timer.timeout.connect(self.update_time)
         self.timer.start(1000)
         
         self.update_time()
     
+    def showEvent(self, event):
+        """다시 보일 때 시계를 즉시 갱신하고 타이머 재개"""
+        super().showEvent(event)
+        self.update_time()
+        self.timer.start(1000)
+
+    def hideEvent(self, event):
+        """다른 탭으로 가려진 동안에는 시계를 갱신하지 않음"""
+        super().hideEvent(event)
+        self.timer.stop()
+
     def update_time(self):
         """시간 업데이트"""
-        from datetime import datetime
-        self.time_label.setText(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+        second = int(time.time())
+        if second == self._shown_second:
+            return
+        self._shown_second = second
+        self.time_label.setText(datetime.fromtimestamp(second).strftime("%Y-%m-%d %H:%M:%S"))
     
     def show_message(self, message: str, timeout: int = 5000):
         """상태 메시지 표시"""
@@ -351,8 +376,6 @@ class LotCellDelegate(QStyledItemDelegate):
         editor = super().createEditor(parent, option, index)
         if isinstance(editor, QLineEdit):
             editor.installEventFilter(self)
-            # 에디터 스타일 설정 (SSOT 적용)
-            editor.setStyleSheet(UIStyles.get_input_style())
         return editor
     
     def updateEditorGeometry(self, editor, option, index):
@@ -392,6 +415,8 @@ class KeyHandlingTableWidget(QTableWidget):
         # LOT 컬럼(5번)에 커스텀 delegate 설정 - MaterialTablePanel 전용 로직이 포함됨
         self.lot_delegate = LotCellDelegate(self)
         self.setItemDelegateForColumn(5, self.lot_delegate)
+        # 셀 에디터 스타일은 뷰포트에 한 번만 적용 (편집할 때마다 에디터에 스타일시트를 다시 파싱하지 않음, SSOT 적용)
+        self.viewport().setStyleSheet(UIStyles.get_input_style())
         
         # 시그널 연결
         self.lot_delegate.enterPressed.connect(self._move_to_next_row)
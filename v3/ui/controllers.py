@@ -92,7 +92,7 @@ class RecipeController:
     def load_recipes(self) -> None:
         """Load recipe names into the recipe panel."""
         try:
-            self.data_manager.load_recipes()
+            # DataManager already read the recipe workbook on creation; reuse it instead of re-reading
             names = self.data_manager.get_recipe_names()
             self.recipe_panel.set_recipes(names)
             logger.info(f"레시피 로드: {len(names)}종")
@@ -21,6 +21,7 @@ class DhrRecipeLoaderDialog(QDialog):
         self.db = DhrDatabaseManager()
         self.selected_recipe = None
         self.selected_materials = []
+        self._recipes_by_id = {}  # 현재 목록의 레시피 ID -> 레시피 (선택 시 재조회하지 않음)
         self.setWindowTitle("레시피 불러오기")
         self.setGeometry(200, 200, 800, 500)
         self._init_ui()
@@ -94,14 +95,14 @@ class DhrRecipeLoaderDialog(QDialog):
     
     def _load_categories(self):
         """분류 항목 로드"""
+        categories = self.db.get_all_categories()
         for combo, cat_type in [
             (self.company_combo, 'company'),
             (self.product_type_combo, 'product_type'),
             (self.drug_combo, 'drug'),
             (self.wear_period_combo, 'wear_period')
         ]:
-            values = self.db.get_categories(cat_type)
-            for v in values:
+            for v in categories.get(cat_type, []):
                 combo.addItem(v, v)
     
     def _load_recipes(self):
@@ -118,6 +119,7 @@ class DhrRecipeLoaderDialog(QDialog):
             wear_period=wear_period if wear_period else None
         )
         
+        self._recipes_by_id = {recipe['id']: recipe for recipe in recipes}
         self.table.setRowCount(len(recipes))
         for row, recipe in enumerate(recipes):
             self.table.setItem(row, 0, QTableWidgetItem(str(recipe['id'])))
@@ -139,13 +141,9 @@ class DhrRecipeLoaderDialog(QDialog):
         
         try:
             recipe_id = int(self.table.item(row, 0).text())
-            recipes = self.db.get_recipes()
             
-            # 선택한 레시피 찾기
-            for r in recipes:
-                if r['id'] == recipe_id:
-                    self.selected_recipe = r
-                    break
+            # 선택한 레시피 찾기 (목록 로드 시 만든 ID 매핑 사용)
+            self.selected_recipe = self._recipes_by_id.get(recipe_id)
             
             if self.selected_recipe:
                 self.selected_materials = self.db.get_recipe_materials(recipe_id)
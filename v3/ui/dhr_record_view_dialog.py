@@ -15,8 +15,12 @@ from models.dhr_database import DhrDatabaseManager
 from models.excel_exporter import ExcelExporter
 from ui.panels.scan_effects_panel import ScanEffectsPanel
 from ui.panels.signature_panel import SignaturePanel
+from ui.components import suspend_updates
 from utils.logger import logger
 
+# 기록 목록 한 번에 조회하는 최대 건수
+_RECORDS_LIMIT = 100
+
 
 class DhrRecordDetailDialog(QDialog):
     """DHR 기록 상세 조회 다이얼로그"""
@@ -92,7 +96,7 @@ class DhrRecordDetailDialog(QDialog):
             resources_path = os.path.join(base_dir, 'resources', 'signature')
             base_image_path = os.path.join(resources_path, 'image.jpeg')
             
-            signature_cfg = config.get('signature', {})
+            signature_cfg = config.get_view('signature', {})
             img_processor = ImageProcessor(resources_path=resources_path, config=signature_cfg)
             signed_image_path = os.path.join(base_dir, 'resources', f"temp_signed_{self.record_data['worker']}.png")
             debug_path = os.path.join(base_dir, '실적서', 'debug_images')
@@ -149,6 +153,8 @@ class DhrRecordViewDialog(QDialog):
         super().__init__(parent)
         self.db_manager = DhrDatabaseManager()
         self.effects_params = effects_params
+        # 마지막 조회가 최대 건수에 걸려 더 오래된 기록이 남아 있는지 여부
+        self._records_truncated = False
         self.setWindowTitle("DHR 기록 조회")
         self.setGeometry(200, 200, 1000, 600)
         self.init_ui()
@@ -214,19 +220,21 @@ class DhrRecordViewDialog(QDialog):
         try:
             start = self.start_date.date().toString("yyyy-MM-dd")
             end = self.end_date.date().toString("yyyy-MM-dd")
-            records = self.db_manager.get_dhr_records(start_date=start, end_date=end)
-            self.table.setRowCount(len(records))
-            for row, record in enumerate(records):
-                chk_box_item = QTableWidgetItem()
-                chk_box_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-                chk_box_item.setCheckState(Qt.Unchecked)
-                self.table.setItem(row, 0, chk_box_item)
-                self.table.setItem(row, 1, QTableWidgetItem(str(record.get('product_lot', ''))))
-                self.table.setItem(row, 2, QTableWidgetItem(str(record.get('product_name', ''))))
-                self.table.setItem(row, 3, QTableWidgetItem(str(record.get('worker', ''))))
-                self.table.setItem(row, 4, QTableWidgetItem(str(record.get('total_amount', ''))))
-                self.table.setItem(row, 5, QTableWidgetItem(str(record.get('work_date', ''))))
-            self.table.resizeColumnsToContents()
+            records = self.db_manager.get_dhr_records(start_date=start, end_date=end, limit=_RECORDS_LIMIT)
+            self._records_truncated = len(records) >= _RECORDS_LIMIT
+            with suspend_updates(self.table):
+                self.table.setRowCount(len(records))
+                for row, record in enumerate(records):
+                    chk_box_item = QTableWidgetItem()
+                    chk_box_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
+                    chk_box_item.setCheckState(Qt.Unchecked)
+                    self.table.setItem(row, 0, chk_box_item)
+                    self.table.setItem(row, 1, QTableWidgetItem(str(record.get('product_lot', ''))))
+                    self.table.setItem(row, 2, QTableWidgetItem(str(record.get('product_name', ''))))
+                    self.table.setItem(row, 3, QTableWidgetItem(str(record.get('worker', ''))))
+                    self.table.setItem(row, 4, QTableWidgetItem(str(record.get('total_amount', ''))))
+                    self.table.setItem(row, 5, QTableWidgetItem(str(record.get('work_date', ''))))
+                self.table.resizeColumnsToContents()
             self.table.setColumnWidth(0, 50)
             logger.info(f"DHR 기록 로드 완료: {len(records)}건")
         except Exception as e:
@@ -235,13 +243,15 @@ class DhrRecordViewDialog(QDialog):
 
     def select_all(self):
         """모든 기록 선택"""
-        for i in range(self.table.rowCount()):
-            self.table.item(i, 0).setCheckState(Qt.Checked)
+        with suspend_updates(self.table):
+            for i in range(self.table.rowCount()):
+                self.table.item(i, 0).setCheckState(Qt.Checked)
 
     def deselect_all(self):
         """모든 기록 선택 해제"""
-        for i in range(self.table.rowCount()):
-            self.table.item(i, 0).setCheckState(Qt.Unchecked)
+        with suspend_updates(self.table):
+            for i in range(self.table.rowCount()):
+                self.table.item(i, 0).setCheckState(Qt.Unchecked)
 
     def show_detail(self):
         """상세 조회"""
@@ -298,11 +308,19 @@ class DhrRecordViewDialog(QDialog):
         if reply == QMessageBox.No:
             return
 
-        success_count = 0
-        for _, lot in checked_items:
+        deleted_rows = []
+        for row, lot in checked_items:
             record = self.db_manager.get_dhr_record_by_lot(lot)
             if record and self.db_manager.delete_dhr_record(record['id']):
-                success_count += 1
-
-        QMessageBox.information(self, "삭제 완료", f"{success_count}건 삭제 완료")
-        self.load_records()
+                deleted_rows.append(row)
+
+        if self._records_truncated:
+            # 최대 건수까지만 조회한 목록이면 다시 조회해 삭제된 자리를 다음 기록으로 채움
+            self.load_records()
+        else:
+            # 조회 범위의 기록이 모두 표시된 경우에는 다시 조회하지 않고 삭제된 행만 뒤에서부터 제거
+            with suspend_updates(self.table):
+                for row in reversed(deleted_rows):
+                    self.table.removeRow(row)
+
+        QMessageBox.information(self, "삭제 완료", f"{len(deleted_rows)}건 삭제 완료")
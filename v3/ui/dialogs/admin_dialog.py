@@ -195,9 +195,8 @@ class AdminDialog(QDialog):
         self.worker_list.clear()
         self.sig_worker_list.clear()
         
-        for worker in self.workers:
-            self.worker_list.addItem(worker)
-            self.sig_worker_list.addItem(worker)
+        self.worker_list.addItems(self.workers)
+        self.sig_worker_list.addItems(self.workers)
 
     def _add_worker(self):
         """작업자 추가"""
@@ -208,7 +207,9 @@ class AdminDialog(QDialog):
                 QMessageBox.warning(self, "오류", f"'{name}'은(는) 이미 존재합니다.")
                 return
             self.workers.append(name)
-            self._load_data()
+            # 전체 목록을 다시 그리지 않고 새 작업자만 두 목록 끝에 추가 (기존 선택 유지)
+            self.worker_list.addItem(name)
+            self.sig_worker_list.addItem(name)
             logger.info(f"작업자 추가: {name}")
 
     def _remove_worker(self):
@@ -226,8 +227,11 @@ class AdminDialog(QDialog):
         )
         
         if reply == QMessageBox.Yes:
-            self.workers.remove(name)
-            self._load_data()
+            # 두 목록은 self.workers와 같은 순서이므로 같은 행만 제거
+            row = self.worker_list.row(item)
+            del self.workers[row]
+            self.worker_list.takeItem(row)
+            self.sig_worker_list.takeItem(row)
             logger.info(f"작업자 삭제: {name}")
 
     def _on_worker_selected(self, current, previous):
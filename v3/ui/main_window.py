@@ -24,7 +24,6 @@ from typing import Tuple
 from models.data_manager import DataManager
 from models.dhr_database import DhrDatabaseManager
 from models.lot_manager import LotManager
-from config.settings import LOT_FILE
 from ui.record_view_dialog import RecordViewDialog
 from utils.logger import logger
 from config.config_manager import config
@@ -79,10 +78,12 @@ class MainWindow(FluentWindow):
 
     def _create_services(self) -> AppServices:
         """앱에서 공유하는 서비스/매니저를 한 곳에서 생성합니다."""
+        data_manager = DataManager()
         return AppServices(
-            data_manager=DataManager(),
+            data_manager=data_manager,
             dhr_db=DhrDatabaseManager(),
-            lot_manager=LotManager(LOT_FILE),
+            # DataManager가 이미 읽어 둔 LOT 데이터를 공유 (OUT.xlsx를 두 번 읽지 않음)
+            lot_manager=data_manager.lot_manager,
         )
 
     def _exit_app(self):
@@ -7,7 +7,7 @@ from PySide6.QtWidgets import (
     QSpinBox, QDoubleSpinBox, QPushButton, QComboBox, 
     QScrollArea, QGroupBox, QMessageBox, QProgressBar, QSplitter
 )
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import Qt
 from PySide6.QtGui import QPixmap, QImage
 import io
 import os
@@ -16,8 +16,23 @@ from config.settings import BASE_PATH
 from utils.logger import logger
 from PIL import Image
 
-# signature_qa_tool의 Generator 로직 재사용
+# signature_qa_tool의 Generator 로직과 생성 워커 스레드 재사용
 from signature_qa_tool.processing.generator import SignatureGenerator
+from signature_qa_tool.ui.main_window import GenerationWorker
+
+# 품질/랜덤화 파라미터 (키, 기본값) - UI 반영과 읽기에서 같은 순서로 순회
+_QUALITY_PARAM_DEFAULTS = (
+    ('gaussian_blur_sigma', 0.7),
+    ('pressure_noise_strength', 0.0),
+    ('ink_alpha_factor', 1.5),
+    ('signature_brightness_factor', 1.25),
+    ('final_contrast_factor', 1.4),
+)
+_RANDOMIZATION_PARAM_DEFAULTS = (
+    ('rotation_angle', 8),
+    ('scale_min', 0.95),
+    ('scale_max', 0.98),
+)
 
 class MockQAConfig:
     """QAConfig 의존성 제거를 위한 Mock 클래스"""
@@ -40,25 +55,6 @@ class MockQAConfig:
         """작업자 목록 반환"""
         return config.workers
 
-class GenerationWorker(QThread):
-    """서명 생성 워커 스레드"""
-    finished = Signal(list)
-    progress = Signal(int)
-
-    def __init__(self, generator, worker_name, num_variations, params):
-        super().__init__()
-        self.generator = generator
-        self.worker_name = worker_name
-        self.num_variations = num_variations
-        self.params = params
-
-    def run(self):
-        images = []
-        for i in range(self.num_variations):
-            image = self.generator.generate_composite_image(self.worker_name, self.params)
-            images.append(image)
-            self.progress.emit(int((i + 1) / self.num_variations * 100))
-        self.finished.emit(images)
 
 class SignatureSettingsPanel(QWidget):
     """서명 품질 및 위치 설정을 위한 통합 패널"""
@@ -229,8 +225,11 @@ class SignatureSettingsPanel(QWidget):
 
     def _load_current_config(self):
         """현재 config.json 값을 로드하여 UI에 반영"""
+        # 서명 설정은 한 번만 복사해서 사용
+        sig_cfg = config.get('signature', {})
+
         # 1. 위치 설정 로드
-        positions = config.get('signature', {}).get('positions', {})
+        positions = sig_cfg.get('positions', {})
         defaults = {'charge': [160, 57], 'review': [222, 54], 'approve': [288, 53]}
         
         for key, (x_spin, y_spin) in self.pos_controls.items():
@@ -239,38 +238,24 @@ class SignatureSettingsPanel(QWidget):
             y_spin.setValue(pos[1])
             
         # 2. 품질 파라미터 로드
-        sig_cfg = config.get('signature', {})
-        self.param_controls['gaussian_blur_sigma'].setValue(sig_cfg.get('gaussian_blur_sigma', 0.7))
-        self.param_controls['pressure_noise_strength'].setValue(sig_cfg.get('pressure_noise_strength', 0.0))
-        self.param_controls['ink_alpha_factor'].setValue(sig_cfg.get('ink_alpha_factor', 1.5))
-        self.param_controls['signature_brightness_factor'].setValue(sig_cfg.get('signature_brightness_factor', 1.25))
-        self.param_controls['final_contrast_factor'].setValue(sig_cfg.get('final_contrast_factor', 1.4))
+        for key, default in _QUALITY_PARAM_DEFAULTS:
+            self.param_controls[key].setValue(sig_cfg.get(key, default))
         
         rand_cfg = sig_cfg.get('randomization', {})
-        self.param_controls['rotation_angle'].setValue(rand_cfg.get('rotation_angle', 8))
-        self.param_controls['scale_min'].setValue(rand_cfg.get('scale_min', 0.95))
-        self.param_controls['scale_max'].setValue(rand_cfg.get('scale_max', 0.98))
+        for key, default in _RANDOMIZATION_PARAM_DEFAULTS:
+            self.param_controls[key].setValue(rand_cfg.get(key, default))
 
     def _get_ui_params(self):
         """UI에서 현재 설정값을 읽어옴"""
-        params = {
-            'gaussian_blur_sigma': self.param_controls['gaussian_blur_sigma'].value(),
-            'pressure_noise_strength': self.param_controls['pressure_noise_strength'].value(),
-            'ink_alpha_factor': self.param_controls['ink_alpha_factor'].value(),
-            'signature_brightness_factor': self.param_controls['signature_brightness_factor'].value(),
-            'final_contrast_factor': self.param_controls['final_contrast_factor'].value(),
-            'randomization': {
-                'rotation_angle': self.param_controls['rotation_angle'].value(),
-                'scale_min': self.param_controls['scale_min'].value(),
-                'scale_max': self.param_controls['scale_max'].value(),
-                # Offset은 UI에서 단순화 위해 생략했으므로 기본값 유지하거나 추가 필요. 여기선 기본값 유지
-                'offset_x': 1, 'offset_y': 2 
-            },
-            # 위치 설정도 포함 (Generator에는 직접 안쓰이지만 config 저장용)
-            'positions': {
-                key: [spin[0].value(), spin[1].value()] 
-                for key, spin in self.pos_controls.items()
-            }
+        params = {key: self.param_controls[key].value() for key, _ in _QUALITY_PARAM_DEFAULTS}
+        randomization = {key: self.param_controls[key].value() for key, _ in _RANDOMIZATION_PARAM_DEFAULTS}
+        # Offset은 UI에서 단순화 위해 생략했으므로 기본값 유지하거나 추가 필요. 여기선 기본값 유지
+        randomization.update({'offset_x': 1, 'offset_y': 2})
+        params['randomization'] = randomization
+        # 위치 설정도 포함 (Generator에는 직접 안쓰이지만 config 저장용)
+        params['positions'] = {
+            key: [spin[0].value(), spin[1].value()] 
+            for key, spin in self.pos_controls.items()
         }
         return params
 
@@ -7,7 +7,7 @@ from PySide6.QtWidgets import (
     QTableWidgetItem, QHeaderView,
     QMessageBox, QTabWidget, QScrollArea, QDialog
 )
-from PySide6.QtCore import Qt, QDate, QTime
+from PySide6.QtCore import Qt, QDate, QTime, QTimer
 from PySide6.QtGui import QColor
 from models.lot_manager import LotManager
 from config.settings import LOT_FILE
@@ -24,6 +24,9 @@ from qfluentwidgets import (
     CardWidget, LineEdit, DoubleSpinBox, DateEdit, TimeEdit, CheckBox
 )
 
+# 읽기 전용(자동계산) 셀 배경색 (행마다 색상 문자열을 다시 파싱하지 않도록 미리 생성)
+_READONLY_CELL_BG = QColor(UITheme.READONLY_BG)
+
 
 class ManualInputInterface(QScrollArea):
     """수기 배합일지 작성 패널"""
@@ -222,7 +225,12 @@ class ManualInputInterface(QScrollArea):
     def _connect_signals(self):
         """시그널 연결"""
         # 제품명 또는 날짜 변경 시 LOT 자동 생성
-        self.product_name_edit.textChanged.connect(self._update_product_lot)
+        # 제품명은 입력이 멈춘 뒤 한 번만 DB 조회 (키 입력마다 LOT 채번 쿼리를 보내지 않음)
+        self._lot_timer = QTimer(self)
+        self._lot_timer.setSingleShot(True)
+        self._lot_timer.setInterval(250)
+        self._lot_timer.timeout.connect(self._update_product_lot)
+        self.product_name_edit.textChanged.connect(lambda _text: self._lot_timer.start())
         self.date_edit.dateChanged.connect(self._update_product_lot)
         
         # 초기 LOT 생성
@@ -230,6 +238,7 @@ class ManualInputInterface(QScrollArea):
 
     def _update_product_lot(self):
         """제품 LOT 자동 생성 (제품명 + YYMMDD)"""
+        self._lot_timer.stop()
         product_name = self.product_name_edit.text().strip()
         date = self.date_edit.date()
         if not product_name:
@@ -253,7 +262,7 @@ class ManualInputInterface(QScrollArea):
             item = QTableWidgetItem("")
             if col == 3:  # 이론계량 - 자동계산
                 item.setFlags(item.flags() & ~Qt.ItemIsEditable)
-                item.setBackground(QColor(UITheme.READONLY_BG))
+                item.setBackground(_READONLY_CELL_BG)
             self.table.setItem(row, col, item)
 
     def _remove_row(self):
@@ -329,6 +338,7 @@ class ManualInputInterface(QScrollArea):
             })
 
         try:
+            self._lot_timer.stop()  # 대기 중인 LOT 갱신이 저장된 LOT 표시를 덮어쓰지 않도록
             saved_lot = self.dhr_db.generate_product_lot(data["product_name"], data["work_date"])
             record_data = {
                 "product_lot": saved_lot,
@@ -460,7 +470,7 @@ class ManualInputInterface(QScrollArea):
             # 이론계량 (자동계산)
             theory_item = QTableWidgetItem("")
             theory_item.setFlags(theory_item.flags() & ~Qt.ItemIsEditable)
-            theory_item.setBackground(QColor(UITheme.READONLY_BG))
+            theory_item.setBackground(_READONLY_CELL_BG)
             self.table.setItem(row, 3, theory_item)
             # 실제배합
             self.table.setItem(row, 4, QTableWidgetItem(""))
@@ -3,7 +3,7 @@ from PySide6.QtWidgets import (
     QTableWidgetItem, QHeaderView, QMessageBox, QMenu,
     QStyledItemDelegate, QLineEdit, QGroupBox
 )
-from PySide6.QtCore import Signal, Qt, QItemSelectionModel, QEvent
+from PySide6.QtCore import Signal, Qt, QItemSelectionModel, QEvent, QTimer
 from PySide6.QtGui import QAction, QColor, QKeySequence
 from datetime import datetime
 from qfluentwidgets import SearchLineEdit
@@ -11,7 +11,9 @@ from utils.logger import logger
 from ui.components import KeyHandlingTableWidget, StyledButton
 from ui.styles import UIStyles, UITheme
 
-
+# LOT 셀 배경색 (셀마다 색상 문자열을 다시 파싱하지 않도록 미리 생성)
+_LOT_CELL_BG = QColor(UITheme.ACCENT_HIGHLIGHT_BG)
+_LOT_CELL_ERROR_BG = QColor(UITheme.ERROR_HIGHLIGHT_BG)
 
 
 class MaterialTablePanel(QWidget):
@@ -28,6 +30,7 @@ class MaterialTablePanel(QWidget):
         self.data_manager = data_manager
         self.current_amount = 0.0 # 현재 배합량 저장
         self._current_highlight_row = -1  # 현재 하이라이트된 LOT 행
+        self._ratios = []  # 행별 배합비율 (표시값 기준, 로드 시 한 번만 파싱)
         self._init_ui()
 
     def _init_ui(self):
@@ -42,7 +45,12 @@ class MaterialTablePanel(QWidget):
         
         self.search_edit = SearchLineEdit(self)
         self.search_edit.setPlaceholderText("품목코드/품목명/LOT 검색...")
-        self.search_edit.textChanged.connect(self._filter_table)
+        # 입력이 멈춘 뒤 한 번만 필터링 (키 입력마다 전체 행을 다시 검사하지 않음)
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(lambda: self._filter_table(self.search_edit.text()))
+        self.search_edit.textChanged.connect(lambda _text: self._filter_timer.start())
         self.search_edit.setFixedHeight(34)
         top_bar.addWidget(self.search_edit, 1)
         
@@ -117,10 +125,13 @@ class MaterialTablePanel(QWidget):
         items = sorted(items, key=lambda x: x.get("순서", 0))
         self.table.blockSignals(True)
         self.table.setRowCount(len(items))
+        self._ratios = []
         for r, m in enumerate(items):
+            ratio_text = f"{float(m.get('배합비율', 0.0)):.2f}"
+            self._ratios.append(float(ratio_text))
             self._set_item(r, 0, m.get("품목코드", ""), editable=False)
             self._set_item(r, 1, m.get("품목명", ""), editable=False)
-            self._set_item(r, 2, f"{float(m.get('배합비율', 0.0)):.2f}", editable=False)
+            self._set_item(r, 2, ratio_text, editable=False)
             self._set_item(r, 3, "", editable=False) # 이론계량
             self._set_item(r, 4, "", editable=False) # 실제배합
             self._set_item(r, 5, "", editable=True)  # 자재LOT
@@ -131,23 +142,15 @@ class MaterialTablePanel(QWidget):
     def update_theory(self, amount: float):
         """이론 배합량 업데이트"""
         self.current_amount = amount
-        rowCount = self.table.rowCount()
-        if rowCount == 0:
+        if not self._ratios:
             return
 
+        # 배합량이 바뀔 때마다 비율 셀 텍스트를 다시 파싱하지 않고 로드 시 저장한 비율 사용
         self.table.blockSignals(True)
-        for r in range(rowCount):
-            item = self.table.item(r, 2) # 배합비율
-            if item is None:
-                continue
-            try:
-                ratio = float(item.text())
-            except ValueError:
-                ratio = 0.0
-            
-            theory = amount * (ratio / 100.0)
-            self._set_item(r, 3, f"{theory:.3f}", editable=False)
-            self._set_item(r, 4, f"{theory:.3f}", editable=False)
+        for r, ratio in enumerate(self._ratios):
+            theory_text = f"{amount * (ratio / 100.0):.3f}"
+            self._set_text(r, 3, theory_text)
+            self._set_text(r, 4, theory_text)
         self.table.blockSignals(False)
         self._check_validation()
 
@@ -165,6 +168,7 @@ class MaterialTablePanel(QWidget):
         logger.info(f"자동 LOT 배정 시작 (작업일자: {work_date})")
 
         assigned_count = 0
+        unassigned_codes = []
         rowCount = self.table.rowCount()
 
         self.table.blockSignals(True)
@@ -184,9 +188,12 @@ class MaterialTablePanel(QWidget):
             else:
                 current_lot = self.table.item(r, 5).text() if self.table.item(r, 5) else ""
                 if not current_lot:
-                    logger.warning(f"LOT 미배정: {item_code}")
+                    unassigned_codes.append(item_code)
 
         self.table.blockSignals(False)
+        # 미배정 자재는 행마다 남기지 않고 한 줄로 모아서 기록
+        if unassigned_codes:
+            logger.warning(f"LOT 미배정 ({len(unassigned_codes)}건): {', '.join(unassigned_codes)}")
 
         if assigned_count > 0:
             QMessageBox.information(self, "배정 완료", f"{assigned_count}개의 자재 LOT이 배정되었습니다.")
@@ -211,6 +218,7 @@ class MaterialTablePanel(QWidget):
     def clear_items(self):
         """테이블 행 전체 초기화"""
         self.table.setRowCount(0)
+        self._ratios = []
         self._check_validation()
 
     def get_data(self) -> dict:
@@ -251,13 +259,13 @@ class MaterialTablePanel(QWidget):
         if self._current_highlight_row >= 0 and self._current_highlight_row < self.table.rowCount():
             old_item = self.table.item(self._current_highlight_row, 5)
             if old_item:
-                old_item.setBackground(QColor(UITheme.ACCENT_HIGHLIGHT_BG))  # 원래 배경색
+                old_item.setBackground(_LOT_CELL_BG)  # 원래 배경색
         
         # 새 하이라이트 적용
         if 0 <= row < self.table.rowCount():
             item = self.table.item(row, 5)
             if item:
-                item.setBackground(QColor(UITheme.ERROR_HIGHLIGHT_BG))  # 빨간색 하이라이트
+                item.setBackground(_LOT_CELL_ERROR_BG)  # 빨간색 하이라이트
             self._current_highlight_row = row
         else:
             self._current_highlight_row = -1
@@ -267,7 +275,7 @@ class MaterialTablePanel(QWidget):
         for r in range(self.table.rowCount()):
             item = self.table.item(r, 5)
             if item:
-                item.setBackground(QColor(UITheme.ACCENT_HIGHLIGHT_BG))
+                item.setBackground(_LOT_CELL_BG)
         self._current_highlight_row = -1
 
     # Internal Methods
@@ -279,10 +287,18 @@ class MaterialTablePanel(QWidget):
         
         # 5번 열(자재LOT) 배경색 강조
         if col == 5:
-            item.setBackground(QColor(UITheme.ACCENT_HIGHLIGHT_BG)) 
+            item.setBackground(_LOT_CELL_BG) 
             
         self.table.setItem(row, col, item)
 
+    def _set_text(self, row, col, text):
+        """읽기 전용 셀의 텍스트만 갱신 (load_items에서 만든 아이템을 재사용, 없을 때만 생성)"""
+        item = self.table.item(row, col)
+        if item is None:
+            self._set_item(row, col, text, editable=False)
+        elif item.text() != text:
+            item.setText(text)
+
     def _on_cell_changed(self, row, column):
         if column == 5:
             # 안전장치: 배합량이 0이거나 입력되지 않았으면 입력 차단
@@ -98,6 +98,8 @@ class RecipeManagementInterface(QWidget):
         
         # [그룹 1] 기본 정보
         info_group = QGroupBox("레시피 정보")
+        # 입력 스타일은 입력 위젯마다 따로 파싱하지 않고 그룹에 한 번 적용 (하위 입력 위젯에 상속)
+        info_group.setStyleSheet(UIStyles.get_input_style())
         info_layout = QVBoxLayout()
         
         # 헬퍼 함수
@@ -114,7 +116,6 @@ class RecipeManagementInterface(QWidget):
         row1.addWidget(lbl1)
         
         self.name_edit = QLineEdit()
-        self.name_edit.setStyleSheet(UIStyles.get_input_style())
         row1.addWidget(self.name_edit)
         info_layout.addLayout(row1)
         
@@ -129,7 +130,6 @@ class RecipeManagementInterface(QWidget):
         self.company_combo = QComboBox()
         self.company_combo.setEditable(False)
         self.company_combo.setMinimumWidth(150)
-        self.company_combo.setStyleSheet(UIStyles.get_input_style())
         row2.addWidget(self.company_combo)
         
         row2.addWidget(create_small_btn("+", lambda: self._add_category('company', self.company_combo)))
@@ -145,7 +145,6 @@ class RecipeManagementInterface(QWidget):
         self.product_type_combo = QComboBox()
         self.product_type_combo.setEditable(False)
         self.product_type_combo.setMinimumWidth(150)
-        self.product_type_combo.setStyleSheet(UIStyles.get_input_style())
         row2.addWidget(self.product_type_combo)
         
         row2.addWidget(create_small_btn("+", lambda: self._add_category('product_type', self.product_type_combo)))
@@ -164,7 +163,6 @@ class RecipeManagementInterface(QWidget):
         
         self.drug_edit = QLineEdit()
         self.drug_edit.setMinimumWidth(150)
-        self.drug_edit.setStyleSheet(UIStyles.get_input_style())
         row3.addWidget(self.drug_edit)
         
         row3.addSpacing(15)
@@ -177,7 +175,6 @@ class RecipeManagementInterface(QWidget):
         self.wear_period_combo = QComboBox()
         self.wear_period_combo.setEditable(False)
         self.wear_period_combo.setMinimumWidth(150)
-        self.wear_period_combo.setStyleSheet(UIStyles.get_input_style())
         row3.addWidget(self.wear_period_combo)
         
         row3.addWidget(create_small_btn("+", lambda: self._add_category('wear_period', self.wear_period_combo)))
@@ -239,22 +236,23 @@ class RecipeManagementInterface(QWidget):
 
     def _load_categories(self):
         """분류 항목 콤보박스 로드"""
+        categories = self.db.get_all_categories()
         # 거래처
         self.company_combo.clear()
         self.company_combo.addItem("", "") 
-        for v in self.db.get_categories('company'):
+        for v in categories.get('company', []):
             self.company_combo.addItem(v, v)
         
         # 제품종류
         self.product_type_combo.clear()
         self.product_type_combo.addItem("", "")
-        for v in self.db.get_categories('product_type'):
+        for v in categories.get('product_type', []):
             self.product_type_combo.addItem(v, v)
         
         # 착용기간
         self.wear_period_combo.clear()
         self.wear_period_combo.addItem("", "")
-        for v in self.db.get_categories('wear_period'):
+        for v in categories.get('wear_period', []):
             self.wear_period_combo.addItem(v, v)
     
     def _add_category(self, cat_type: str, combo: QComboBox):
@@ -9,6 +9,22 @@ from ui.styles import UITheme
 HIGHLIGHT_STYLE = f"border: 1px solid {UITheme.MINT_ACCENT}; border-radius: 6px;"
 NORMAL_STYLE = ""
 
+# 하이라이트 상태별 스타일시트 (호출마다 포맷하지 않도록 모듈 로드 시 한 번만 생성)
+_AMOUNT_BASE_STYLE = (
+    f"background-color: {UITheme.SURFACE_ALT}; color: {UITheme.TEXT_PRIMARY}; "
+    "font-weight: 600; font-size: 13pt; min-width: 120px;"
+)
+_AMOUNT_STYLE = f"QDoubleSpinBox {{ {_AMOUNT_BASE_STYLE} }}"
+_AMOUNT_HIGHLIGHT_STYLE = f"QDoubleSpinBox {{ {_AMOUNT_BASE_STYLE} {HIGHLIGHT_STYLE} }}"
+_RECIPE_HIGHLIGHT_STYLE = f"QComboBox {{ {HIGHLIGHT_STYLE} }}"
+
+# 하이라이트 대상 -> (레시피 콤보 스타일, 배합량 스타일)
+_HIGHLIGHT_STYLES = {
+    "recipe": (_RECIPE_HIGHLIGHT_STYLE, _AMOUNT_STYLE),
+    "amount": (NORMAL_STYLE, _AMOUNT_HIGHLIGHT_STYLE),
+    None: (NORMAL_STYLE, _AMOUNT_STYLE),
+}
+
 class RecipePanel(QWidget):
     """레시피 선택 및 배합량 입력을 담당하는 패널"""
     
@@ -18,6 +34,7 @@ class RecipePanel(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._highlighted = None
         self._init_ui()
         self._setup_workflow()
 
@@ -53,10 +70,7 @@ class RecipePanel(QWidget):
         self.amount_spin.setSpecialValueText(" ")
         
         # 스타일 적용 (노란색 배경, 굵은 글씨)
-        self.amount_spin.setStyleSheet(
-            f"QDoubleSpinBox {{ background-color: {UITheme.SURFACE_ALT}; color: {UITheme.TEXT_PRIMARY}; "
-            "font-weight: 600; font-size: 13pt; min-width: 120px; }"
-        )
+        self.amount_spin.setStyleSheet(_AMOUNT_STYLE)
         
         self.amount_spin.valueChanged.connect(self._on_amount_changed)
         self.amount_spin.lineEdit().installEventFilter(self)
@@ -68,29 +82,26 @@ class RecipePanel(QWidget):
         """워크플로우 초기화 - 첫 번째로 레시피 선택에 빨간 테두리"""
         self.highlight_recipe()
 
+    def _apply_highlight(self, target):
+        """하이라이트 상태 전환 (같은 상태면 스타일시트를 다시 적용하지 않음)"""
+        if target == self._highlighted:
+            return
+        recipe_style, amount_style = _HIGHLIGHT_STYLES[target]
+        self.recipe_combo.setStyleSheet(recipe_style)
+        self.amount_spin.setStyleSheet(amount_style)
+        self._highlighted = target
+
     def highlight_recipe(self):
         """레시피 콤보박스에 빨간 테두리"""
-        self.recipe_combo.setStyleSheet(f"QComboBox {{ {HIGHLIGHT_STYLE} }}")
-        self.amount_spin.setStyleSheet(
-            f"QDoubleSpinBox {{ background-color: {UITheme.SURFACE_ALT}; color: {UITheme.TEXT_PRIMARY}; "
-            "font-weight: 600; font-size: 13pt; min-width: 120px; }"
-        )
+        self._apply_highlight("recipe")
 
     def highlight_amount(self):
         """배합량 입력칸에 빨간 테두리"""
-        self.recipe_combo.setStyleSheet("")
-        self.amount_spin.setStyleSheet(
-            f"QDoubleSpinBox {{ background-color: {UITheme.SURFACE_ALT}; color: {UITheme.TEXT_PRIMARY}; "
-            f"font-weight: 600; font-size: 13pt; min-width: 120px; {HIGHLIGHT_STYLE} }}"
-        )
+        self._apply_highlight("amount")
 
     def clear_highlights(self):
         """모든 하이라이트 제거"""
-        self.recipe_combo.setStyleSheet("")
-        self.amount_spin.setStyleSheet(
-            f"QDoubleSpinBox {{ background-color: {UITheme.SURFACE_ALT}; color: {UITheme.TEXT_PRIMARY}; "
-            "font-weight: 600; font-size: 13pt; min-width: 120px; }"
-        )
+        self._apply_highlight(None)
 
     def set_recipes(self, recipes: list):
         """레시피 목록 설정"""
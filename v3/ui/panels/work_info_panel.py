@@ -57,16 +57,20 @@ class WorkerInputDialog(QDialog):
         subtitle.setAlignment(Qt.AlignCenter)
         card_layout.addWidget(subtitle)
 
+        # 설정 조회는 매번 복사본을 만들므로 한 번만 읽어서 재사용
+        workers = config.workers
+        last_worker = config.last_worker
+
         self.worker_combo = QComboBox()
-        self.worker_combo.addItems(list(config.workers))
+        self.worker_combo.addItems(workers)
         self.worker_combo.setStyleSheet(UIStyles.get_input_style())
         self.worker_combo.setFixedHeight(38)
         card_layout.addWidget(self.worker_combo)
 
-        if current_worker and current_worker in config.workers:
+        if current_worker and current_worker in workers:
             self.worker_combo.setCurrentText(current_worker)
-        elif config.last_worker and config.last_worker in config.workers:
-            self.worker_combo.setCurrentText(config.last_worker)
+        elif last_worker and last_worker in workers:
+            self.worker_combo.setCurrentText(last_worker)
 
         admin_btn = QPushButton("관리자 모드")
         admin_btn.setCursor(Qt.PointingHandCursor)
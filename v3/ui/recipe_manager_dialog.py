@@ -481,27 +481,23 @@ class RecipeManagerDialog(QDialog):
 
             # 엑셀 저장
 
-            data = []
+            # 행마다 dict를 만들지 않고 컬럼별 리스트로 바로 채움
 
-            for recipe_name, items in self.data_manager.recipes.items():
-
-                for item in items:
-
-                    data.append({
+            columns = {'레시피': [], '품목코드': [], '품목명': [], '배합비율': []}
 
-                        '레시피': recipe_name,
+            for recipe_name, items in self.data_manager.recipes.items():
 
-                        '품목코드': item['품목코드'],
+                columns['레시피'].extend([recipe_name] * len(items))
 
-                        '품목명': item['품목명'],
+                columns['품목코드'].extend(item['품목코드'] for item in items)
 
-                        '배합비율': item['배합비율']
+                columns['품목명'].extend(item['품목명'] for item in items)
 
-                    })
+                columns['배합비율'].extend(item['배합비율'] for item in items)
 
 
 
-            df = pd.DataFrame(data)
+            df = pd.DataFrame(columns)
 
             from config.settings import RECIPE_FILE
             df.to_excel(RECIPE_FILE, index=False, engine='openpyxl')
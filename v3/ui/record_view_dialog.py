@@ -22,7 +22,10 @@ from models.excel_exporter import ExcelExporter
 
 from utils.logger import logger
 from ui.styles import UIStyles, UITheme
-from ui.components import StyledButton
+from ui.components import StyledButton, suspend_updates
+
+# 수정 모드에서 편집 가능 필드 스타일 (Premium Mint)
+_EDIT_FIELD_STYLE = f"background-color: {UITheme.ACCENT_RGBA_18}; border: 1px solid {UITheme.MINT_ACCENT}; color: {UITheme.TEXT_PRIMARY};"
 
 
 
@@ -143,9 +146,8 @@ class RecordDetailDialog(QDialog):
             self.save_btn.setEnabled(True)
             
             # 편집 가능 필드 스타일 변경 (Premium Mint)
-            edit_style = f"background-color: {UITheme.ACCENT_RGBA_18}; border: 1px solid {UITheme.MINT_ACCENT}; color: {UITheme.TEXT_PRIMARY};"
-            self.worker_edit.setStyleSheet(edit_style)
-            self.amount_edit.setStyleSheet(edit_style)
+            self.worker_edit.setStyleSheet(_EDIT_FIELD_STYLE)
+            self.amount_edit.setStyleSheet(_EDIT_FIELD_STYLE)
             
             QMessageBox.information(self, "수정 모드", 
                 "수정 모드가 활성화되었습니다.\n\n"
@@ -231,8 +233,7 @@ class RecordDetailDialog(QDialog):
                 self.amount_edit.setStyleSheet(UIStyles.get_input_style())
                 
                 # lot_data 업데이트
-                self.lot_data = self.data_manager.get_all_records_df()
-                self.lot_data = self.lot_data[self.lot_data['product_lot'] == product_lot]
+                self.lot_data = self.data_manager.get_record_df_by_lot(product_lot)
             else:
                 QMessageBox.warning(self, "수정 실패", "기록 수정에 실패했습니다.")
                 
@@ -271,10 +272,13 @@ class RecordDetailDialog(QDialog):
 class RecordViewDialog(QDialog):
     """배합 기록 조회 다이얼로그"""
 
+    PAGE_SIZE = 100  # 한 페이지에 표시할 기록 수
+
     def __init__(self, data_manager, effects_params, parent=None):
         super().__init__(parent)
         self.data_manager = data_manager
         self.effects_params = effects_params  # 스캔 효과 파라미터 저장
+        self.current_page = 0
         self.setWindowTitle("배합 기록 조회")
         self.setGeometry(200, 200, 1200, 800)
         self.init_ui()
@@ -294,8 +298,14 @@ class RecordViewDialog(QDialog):
         filter_layout.addWidget(QLabel("종료일:"))
         self.end_date = QDateEdit(calendarPopup=True, date=QDate.currentDate())
         filter_layout.addWidget(self.end_date)
+        filter_layout.addWidget(QLabel("검색어:"))
+        self.keyword_edit = QLineEdit()
+        self.keyword_edit.setPlaceholderText("제품LOT / 레시피 / 작업자")
+        self.keyword_edit.setClearButtonEnabled(True)
+        self.keyword_edit.returnPressed.connect(self.search_records)
+        filter_layout.addWidget(self.keyword_edit)
         search_btn = QPushButton("조회")
-        search_btn.clicked.connect(self.load_records)
+        search_btn.clicked.connect(self.search_records)
         filter_layout.addWidget(search_btn)
         filter_layout.addStretch()
         filter_group.setLayout(filter_layout)
@@ -311,6 +321,20 @@ class RecordViewDialog(QDialog):
         self.table.doubleClicked.connect(self.show_detail)
         layout.addWidget(self.table)
 
+        # 페이지 이동
+        page_layout = QHBoxLayout()
+        page_layout.addStretch()
+        self.prev_page_btn = QPushButton("◀ 이전")
+        self.prev_page_btn.clicked.connect(self.prev_page)
+        page_layout.addWidget(self.prev_page_btn)
+        self.page_label = QLabel("1 페이지")
+        page_layout.addWidget(self.page_label)
+        self.next_page_btn = QPushButton("다음 ▶")
+        self.next_page_btn.clicked.connect(self.next_page)
+        page_layout.addWidget(self.next_page_btn)
+        page_layout.addStretch()
+        layout.addLayout(page_layout)
+
         # 품목별 집계 그룹
         agg_group = QGroupBox("품목별 배합량 집계")
         agg_layout = QHBoxLayout()
@@ -419,24 +443,56 @@ class RecordViewDialog(QDialog):
             logger.error(f"품목별 집계 오류: {e}")
             QMessageBox.critical(self, "오류", "배합량을 집계하는 중 오류가 발생했습니다.")
 
+    def search_records(self):
+        """검색 조건 변경 시 첫 페이지부터 조회"""
+        self.current_page = 0
+        self.load_records()
+
+    def prev_page(self):
+        """이전 페이지 조회"""
+        if self.current_page > 0:
+            self.current_page -= 1
+            self.load_records()
+
+    def next_page(self):
+        """다음 페이지 조회"""
+        self.current_page += 1
+        self.load_records()
+
     def load_records(self):
-        """기록 로드"""
+        """현재 페이지 기록 로드"""
         try:
             start = self.start_date.date().toString("yyyy-MM-dd")
             end = self.end_date.date().toString("yyyy-MM-dd")
-            records = self.data_manager.get_mixing_records(start_date=start, end_date=end)
-            self.table.setRowCount(len(records))
-            for row, record in enumerate(records):
-                chk_box_item = QTableWidgetItem()
-                chk_box_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
-                chk_box_item.setCheckState(Qt.Unchecked)
-                self.table.setItem(row, 0, chk_box_item)
-                self.table.setItem(row, 1, QTableWidgetItem(str(record.get('product_lot', ''))))
-                self.table.setItem(row, 2, QTableWidgetItem(str(record.get('worker', ''))))
-                self.table.setItem(row, 3, QTableWidgetItem(str(record.get('recipe_name', ''))))
-                self.table.setItem(row, 4, QTableWidgetItem(str(record.get('total_amount', ''))))
-                self.table.setItem(row, 5, QTableWidgetItem(f"{record.get('work_date', '')} {record.get('work_time', '')}"))
-            self.table.resizeColumnsToContents()
+            keyword = self.keyword_edit.text().strip()
+            # 한 건 더 조회하여 다음 페이지 존재 여부 판단
+            records = self.data_manager.get_mixing_records(
+                start_date=start, end_date=end, keyword=keyword,
+                limit=self.PAGE_SIZE + 1, offset=self.current_page * self.PAGE_SIZE
+            )
+            if not records and self.current_page > 0:
+                # 삭제 등으로 현재 페이지가 비면 이전 페이지로 이동
+                self.current_page -= 1
+                self.load_records()
+                return
+            has_next = len(records) > self.PAGE_SIZE
+            records = records[:self.PAGE_SIZE]
+            self.prev_page_btn.setEnabled(self.current_page > 0)
+            self.next_page_btn.setEnabled(has_next)
+            self.page_label.setText(f"{self.current_page + 1} 페이지")
+            with suspend_updates(self.table):
+                self.table.setRowCount(len(records))
+                for row, record in enumerate(records):
+                    chk_box_item = QTableWidgetItem()
+                    chk_box_item.setFlags(Qt.ItemIsUserCheckable | Qt.ItemIsEnabled)
+                    chk_box_item.setCheckState(Qt.Unchecked)
+                    self.table.setItem(row, 0, chk_box_item)
+                    self.table.setItem(row, 1, QTableWidgetItem(str(record.get('product_lot', ''))))
+                    self.table.setItem(row, 2, QTableWidgetItem(str(record.get('worker', ''))))
+                    self.table.setItem(row, 3, QTableWidgetItem(str(record.get('recipe_name', ''))))
+                    self.table.setItem(row, 4, QTableWidgetItem(str(record.get('total_amount', ''))))
+                    self.table.setItem(row, 5, QTableWidgetItem(f"{record.get('work_date', '')} {record.get('work_time', '')}"))
+                self.table.resizeColumnsToContents()
             self.table.setColumnWidth(0, 50)
             logger.info(f"기록 로드 완료: {len(records)}건")
         except Exception as e:
@@ -445,13 +501,15 @@ class RecordViewDialog(QDialog):
 
     def select_all(self):
         """모든 기록 선택"""
-        for i in range(self.table.rowCount()):
-            self.table.item(i, 0).setCheckState(Qt.Checked)
+        with suspend_updates(self.table):
+            for i in range(self.table.rowCount()):
+                self.table.item(i, 0).setCheckState(Qt.Checked)
 
     def deselect_all(self):
         """모든 기록 선택 해제"""
-        for i in range(self.table.rowCount()):
-            self.table.item(i, 0).setCheckState(Qt.Unchecked)
+        with suspend_updates(self.table):
+            for i in range(self.table.rowCount()):
+                self.table.item(i, 0).setCheckState(Qt.Unchecked)
 
     def show_detail(self):
         """상세 조회"""
@@ -461,8 +519,7 @@ class RecordViewDialog(QDialog):
             return
         try:
             product_lot = self.table.item(current_row, 1).text()
-            all_records_df = self.data_manager.get_all_records_df()
-            lot_data = all_records_df[all_records_df['product_lot'] == product_lot]
+            lot_data = self.data_manager.get_record_df_by_lot(product_lot)
             if not lot_data.empty:
                 # 상세 다이얼로그에 효과 파라미터 전달
                 detail_dialog = RecordDetailDialog(lot_data, self.data_manager, self.effects_params, self)
@@ -18,6 +18,9 @@ class SidebarHoverController(QObject):
         self._enabled = bool(config.sidebar_hover_expand)
         self._hover_expanded = False
         self._filter_widgets: List[QWidget] = []
+        # Resolved once in init_behavior; the poll timer and hover events reuse them
+        self._nav = None
+        self._panel = None
 
         self._collapse_timer = QTimer(window)
         self._collapse_timer.setSingleShot(True)
@@ -52,6 +55,8 @@ class SidebarHoverController(QObject):
 
         nav.setCollapsible(True)
         panel = getattr(nav, "panel", None)
+        self._nav = nav
+        self._panel = panel
         hover_widgets = [nav]
         if panel is not None:
             hover_widgets.append(panel)
@@ -75,14 +80,18 @@ class SidebarHoverController(QObject):
             self._poll_timer.start()
 
     def handle_filter_event(self, obj, event) -> None:
-        nav = getattr(self._window, "navigationInterface", None)
-        panel = getattr(nav, "panel", None) if nav else None
+        # Every event of every sidebar descendant passes through here (paint, move, ...);
+        # only enter/leave matter, so reject the rest before any widget lookups.
+        et = event.type()
+        if et != QEvent.Enter and et != QEvent.Leave:
+            return
+
+        nav, panel = self._nav, self._panel
 
         if obj in self._filter_widgets or obj in (nav, panel):
-            et = event.type()
             if et == QEvent.Enter:
                 self._on_hover_enter()
-            elif et == QEvent.Leave:
+            else:
                 self._on_hover_leave()
 
     def _on_hover_enter(self) -> None:
@@ -91,8 +100,7 @@ class SidebarHoverController(QObject):
 
         self._collapse_timer.stop()
 
-        nav = getattr(self._window, "navigationInterface", None)
-        panel = getattr(nav, "panel", None) if nav else None
+        nav, panel = self._nav, self._panel
         if nav is None or panel is None:
             return
 
@@ -120,8 +128,7 @@ class SidebarHoverController(QObject):
             self._collapse_timer.start()
 
     def _is_cursor_in_sidebar(self) -> bool:
-        nav = getattr(self._window, "navigationInterface", None)
-        panel = getattr(nav, "panel", None) if nav else None
+        nav, panel = self._nav, self._panel
         if nav is None or panel is None:
             return False
 
@@ -165,8 +172,7 @@ class SidebarHoverController(QObject):
         if not self._hover_expanded:
             return
 
-        nav = getattr(self._window, "navigationInterface", None)
-        panel = getattr(nav, "panel", None) if nav else None
+        nav, panel = self._nav, self._panel
         if nav is None or panel is None:
             self._hover_expanded = False
             return
@@ -1,5 +1,7 @@
 """UI 스타일 및 테마 상수 정의 (Fluent-compatible)."""
 
+from functools import lru_cache
+
 
 class UITheme:
     """중앙화된 UI 테마 상수 - 프리미엄 다크 스타일"""
@@ -60,9 +62,13 @@ class UITheme:
 
 
 class UIStyles:
-    """재사용 가능한 스타일시트 - 프리미엄 스타일 (SSOT)"""
+    """재사용 가능한 스타일시트 - 프리미엄 스타일 (SSOT)
+
+    테마 상수는 실행 중 바뀌지 않으므로 각 스타일시트 문자열은 처음 한 번만 만들고 재사용합니다.
+    """
     
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_base_style():
         """기본 위젯 및 폰트 설정"""
         return f"""
@@ -142,6 +148,7 @@ class UIStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_navigation_style():
         """사이드바 (NavigationInterface) 스타일"""
         return f"""
@@ -171,6 +178,7 @@ class UIStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_input_style():
         """입력 필드 (ComboBox, LineEdit, SpinBox) 스타일"""
         return f"""
@@ -227,6 +235,7 @@ class UIStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_scrollbar_style():
         """스크롤바 스타일"""
         return f"""
@@ -249,6 +258,7 @@ class UIStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_main_style():
         """전체 글로벌 스타일 통합 반환"""
         return (
@@ -259,6 +269,7 @@ class UIStyles:
         )
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_primary_button_style():
         """Primary (Gradient) 버튼 스타일"""
         return f"""
@@ -286,6 +297,7 @@ class UIStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_secondary_button_style():
         """Secondary (Outline/Ghost) 버튼 스타일"""
         return f"""
@@ -309,6 +321,7 @@ class UIStyles:
         """
         
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_danger_button_style():
         """Danger (Red Outline) 버튼 스타일"""
         return f"""
@@ -330,6 +343,7 @@ class UIStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_card_style():
         """카드 위젯 공통 스타일"""
         return f"""
@@ -341,6 +355,7 @@ class UIStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_table_style():
         """테이블 위젯 스타일"""
         return f"""
@@ -380,6 +395,7 @@ class UIStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def get_dialog_style():
         """모달 다이얼로그 (프레임리스) 스타일"""
         return f"""
@@ -2,9 +2,13 @@
 일괄 생성 관련 공통 유틸리티 함수
 날짜 파싱, 벌크 항목 파싱, 자재 정보 추출 등을 제공합니다.
 """
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import List, Dict
 
+# 엑셀 시리얼 넘버 기준일 / ISO 외 허용 날짜 형식
+_EXCEL_EPOCH = datetime(1899, 12, 30)
+_DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%Y.%m.%d", "%m/%d/%Y", "%m-%d-%Y")
+
 
 def parse_date_cell(value: str) -> str:
     """날짜 셀 값을 YYYY-MM-DD 형식으로 파싱합니다.
@@ -15,17 +19,22 @@ def parse_date_cell(value: str) -> str:
     if not raw:
         return ""
 
+    # 대부분의 입력인 YYYY-MM-DD는 형식 후보를 돌지 않고 바로 확인
+    if len(raw) == 10:
+        try:
+            return date.fromisoformat(raw).isoformat()
+        except ValueError:
+            pass
+
     try:
         num = float(raw)
         if num > 0:
-            base = datetime(1899, 12, 30)
-            dt = base + timedelta(days=num)
+            dt = _EXCEL_EPOCH + timedelta(days=num)
             return dt.strftime("%Y-%m-%d")
     except ValueError:
         pass
 
-    candidates = ["%Y-%m-%d", "%Y/%m/%d", "%Y.%m.%d", "%m/%d/%Y", "%m-%d-%Y"]
-    for fmt in candidates:
+    for fmt in _DATE_FORMATS:
         try:
             dt = datetime.strptime(raw, fmt)
             return dt.strftime("%Y-%m-%d")
@@ -0,0 +1,88 @@
+"""
+SQLite 연결 재사용 유틸리티
+스레드마다 연결 하나를 열어 두고 DB 관리 클래스의 get_connection 호출 간에 재사용합니다.
+"""
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List
+
+# 연결별 메모리 매핑 크기 (bytes) / 페이지 캐시 크기 (음수 = KiB 단위)
+MMAP_SIZE = 256 * 1024 * 1024
+CACHE_SIZE_KIB = -64 * 1024
+
+
+class ThreadLocalConnection:
+    """DB 파일 하나에 대해 스레드별 연결을 관리합니다.
+
+    sqlite3 연결은 만든 스레드에서만 사용하고, close()는 모든 스레드의 연결을 닫습니다.
+    중첩 사용 시 같은 연결을 공유하며 가장 바깥 블록이 끝날 때만 트랜잭션을 정리합니다.
+    메인(UI) 스레드만 연결을 유지하고, 작업 스레드의 연결은 가장 바깥 블록이 끝나면 닫습니다.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: List[sqlite3.Connection] = []
+
+    def _open(self) -> sqlite3.Connection:
+        """새 연결을 열고 공통 PRAGMA를 적용합니다."""
+        # close()가 다른 스레드에서 호출될 수 있으므로 스레드 검사는 끄고 사용은 스레드별로 제한
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA foreign_keys = ON")
+        # WAL: 조회가 저장을 막지 않음 / NORMAL 동기화는 WAL에서 DB 손상 없이 커밋당 fsync를 줄임
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        # 범위 조회가 페이지 복사 대신 메모리 매핑을 타도록 하고 페이지 캐시를 넉넉히 둠
+        conn.execute(f"PRAGMA mmap_size = {MMAP_SIZE}")
+        conn.execute(f"PRAGMA cache_size = {CACHE_SIZE_KIB}")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.row_factory = sqlite3.Row  # 딕셔너리 형태로 결과 반환
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """현재 스레드의 연결을 빌려줍니다 (없으면 새로 엶)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._open()
+            self._local.conn = conn
+            self._local.depth = 0
+
+        self._local.depth += 1
+        try:
+            yield conn
+        finally:
+            self._local.depth -= 1
+            if self._local.depth == 0:
+                # 커밋되지 않은 변경은 연결을 닫을 때처럼 버림 (다음 호출에 섞이지 않도록)
+                if conn.in_transaction:
+                    conn.rollback()
+                # 작업 스레드는 끝날 때 연결을 닫아 줄 곳이 없으므로 사용 후 바로 닫음
+                if threading.current_thread() is not threading.main_thread():
+                    self._local.conn = None
+                    self._release(conn)
+
+    def _release(self, conn: sqlite3.Connection):
+        """연결 하나를 목록에서 빼고 닫습니다."""
+        with self._lock:
+            if conn in self._connections:
+                self._connections.remove(conn)
+        try:
+            conn.close()
+        except sqlite3.Error:
+            pass
+
+    def close(self):
+        """열려 있는 모든 스레드의 연결을 닫습니다."""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        self._local = threading.local()
@@ -84,11 +84,9 @@ class Logger:
         self._logger.critical(message, **kwargs)
 
     def log_mixing_operation(self, operation, recipe_name, worker, **details):
-        log_message = f"[Mixing] {operation} | recipe={recipe_name} | worker={worker}"
-        if details:
-            detail_str = " | ".join([f"{k}: {v}" for k, v in details.items()])
-            log_message += f" | {detail_str}"
-        self.info(log_message)
+        parts = [f"[Mixing] {operation}", f"recipe={recipe_name}", f"worker={worker}"]
+        parts.extend(f"{k}: {v}" for k, v in details.items())
+        self.info(" | ".join(parts))
 
     def log_error_with_context(self, error, context=None):
         import traceback
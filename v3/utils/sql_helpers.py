@@ -0,0 +1,77 @@
+"""
+SQL 조회 조건 조립 유틸리티
+배합/DHR 기록 조회에서 공통으로 쓰는 WHERE 절 생성과 LOT 시퀀스 조회를 제공합니다.
+"""
+import sqlite3
+from typing import Any, List, Sequence, Tuple
+
+# (조건식, 바인딩 값) - 값이 튜플이면 조건식의 ? 자리에 차례로 바인딩
+Condition = Tuple[str, Any]
+
+# LOT 접미사 중 숫자로만 된 시퀀스의 최댓값 ({table}/{name_column}은 코드 상수만 사용)
+_MAX_LOT_SEQUENCE_SQL = """
+    SELECT MAX(CAST(substr(product_lot, :seq_start) AS INTEGER)) AS max_seq
+    FROM {table}
+    WHERE work_date = :work_date AND {name_column} = :name
+      AND substr(product_lot, 1, :base_len) = :base_lot
+      AND substr(product_lot, :seq_start) GLOB '[0-9]*'
+      AND substr(product_lot, :seq_start) NOT GLOB '*[^0-9]*'
+"""
+
+
+def build_where_clause(conditions: Sequence[Condition], base: str = "1=1") -> Tuple[str, List[Any]]:
+    """값이 있는 조건만 AND로 묶어 WHERE 절 본문과 파라미터를 반환합니다.
+
+    Args:
+        conditions: (조건식, 값) 목록. 값이 None 또는 빈 문자열이면 제외합니다.
+        base: 항상 포함할 기본 조건
+
+    Returns:
+        (WHERE 절 본문, 바인딩 파라미터 리스트)
+    """
+    clauses = [base]
+    params: List[Any] = []
+    for clause, value in conditions:
+        if value is None or value == "":
+            continue
+        clauses.append(clause)
+        if isinstance(value, tuple):
+            params.extend(value)
+        else:
+            params.append(value)
+    return " AND ".join(clauses), params
+
+
+def escape_like(keyword: str, escape: str = "\\") -> str:
+    """LIKE 부분 일치 패턴을 만듭니다 (%, _ 와일드카드 문자는 이스케이프)."""
+    escaped = (
+        keyword.replace(escape, escape + escape)
+        .replace("%", escape + "%")
+        .replace("_", escape + "_")
+    )
+    return f"%{escaped}%"
+
+
+def max_lot_sequence(conn: sqlite3.Connection, table: str, name_column: str,
+                     name: str, work_date: str, base_lot: str) -> int:
+    """같은 날짜/이름으로 발급된 LOT 중 base_lot 뒤 숫자 시퀀스의 최댓값을 반환합니다 (없으면 0).
+
+    Args:
+        conn: DB 연결
+        table: 기록 테이블명 (mixing_records / dhr_records)
+        name_column: 레시피/제품명 컬럼명
+        name: 레시피/제품명
+        work_date: 작업 날짜 (YYYY-MM-DD)
+        base_lot: 시퀀스 앞부분 ({이름}{YYMMDD})
+    """
+    cursor = conn.execute(
+        _MAX_LOT_SEQUENCE_SQL.format(table=table, name_column=name_column),
+        {
+            "work_date": work_date,
+            "name": name,
+            "base_lot": base_lot,
+            "base_len": len(base_lot),
+            "seq_start": len(base_lot) + 1,
+        },
+    )
+    return cursor.fetchone()[0] or 0